@@ -9,10 +9,15 @@ Author: Ray B.
 Version: 1.0.0
 """
 
+import multiprocessing
+
 from src.lighthouse import LighthouseApp
 
 
 if __name__ == "__main__":
+    # Required for process-mode nodes in frozen (PyInstaller) builds
+    multiprocessing.freeze_support()
+
     # Create and run the application
     app = LighthouseApp()
     app.run()
@@ -0,0 +1,275 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+
+def canonical_json(value: Any) -> str:
+    """Serialize a value deterministically (sorted keys, compact separators)."""
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), default=repr)
+
+
+def content_key(*parts: Any) -> str:
+    """
+    Build a stable content hash from JSON-serializable parts.
+
+    Identical parts always produce the same key, across runs and processes.
+    """
+    return hashlib.sha256(canonical_json(parts).encode("utf-8")).hexdigest()
+
+
+class ResultCache:
+    """
+    In-memory, content-addressed cache of node results with LRU eviction.
+
+    Entries are keyed by a hash of the node type, its resolved fields and
+    the input item (see NodeBase.cache_key). The least recently used
+    entries are evicted once either the entry count or the total size
+    limit is exceeded, and entries expire after their TTL.
+
+    Attributes:
+        max_entries (int): Maximum number of cached results
+        max_bytes (int): Maximum total size of cached results (JSON bytes)
+        hits (int): Lookups answered from the cache
+        misses (int): Lookups that were not cached or had expired
+        evictions (int): Entries dropped to respect the limits
+    """
+
+    def __init__(self, max_entries: int = 1024, max_bytes: int = 64 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[str, Tuple[Any, int, Optional[float]]]" = (
+            OrderedDict()
+        )
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        """
+        Look up a result.
+
+        Returns:
+            Tuple of (hit, value); value is None on a miss
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[2] is not None and entry[2] < time.time():
+                self._remove(key)
+                entry = None
+
+            if entry is None:
+                self.misses += 1
+                return False, None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return True, entry[0]
+
+    def put(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Store a result, evicting least recently used entries as needed.
+
+        Args:
+            key: Content key of the result
+            value: JSON-serializable result
+            ttl: Seconds until the entry expires (None keeps it until evicted)
+        """
+        size = len(canonical_json(value))
+        if size > self.max_bytes:
+            return
+
+        expires_at = time.time() + ttl if ttl is not None else None
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (value, size, expires_at)
+            self._bytes += size
+
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop every entry (counters are kept)."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Snapshot of the cache counters and current size."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+            }
+
+    def _remove(self, key: str) -> None:
+        _, size, _ = self._entries.pop(key)
+        self._bytes -= size
+
+
+class ResponseStore:
+    """
+    Durable key/value store for expensive responses, backed by SQLite.
+
+    Values survive restarts and are shared between processes using the same
+    file. Total size is bounded: a background thread periodically deletes
+    the least recently used rows once the store exceeds max_bytes and
+    returns the freed pages to the filesystem.
+
+    Attributes:
+        path (str): SQLite database file
+        max_bytes (int): Size the store is compacted back under
+        hits (int): Lookups answered from the store
+        misses (int): Lookups that found nothing
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_bytes: int = 256 * 1024 * 1024,
+        compact_interval: float = 60.0,
+    ) -> None:
+        """
+        Open (or create) the store and start background compaction.
+
+        Args:
+            path: SQLite database file; parent directories are created
+            max_bytes: Maximum total size of stored values
+            compact_interval: Seconds between compaction passes
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        self.compact_interval = compact_interval
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._closed = threading.Event()
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._db = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        with self._lock:
+            # auto_vacuum only takes effect on a fresh database
+            self._db.execute("PRAGMA auto_vacuum = INCREMENTAL")
+            self._db.execute("PRAGMA journal_mode = WAL")
+            self._db.execute("PRAGMA synchronous = NORMAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                " key TEXT PRIMARY KEY,"
+                " value BLOB NOT NULL,"
+                " size INTEGER NOT NULL,"
+                " created REAL NOT NULL,"
+                " accessed REAL NOT NULL)"
+            )
+            self._db.execute(
+                "CREATE INDEX IF NOT EXISTS responses_accessed"
+                " ON responses (accessed)"
+            )
+            self._db.commit()
+
+        self._compactor = threading.Thread(
+            target=self._compact_loop, name="lighthouse-store-compactor", daemon=True
+        )
+        self._compactor.start()
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return the stored value for key, or None."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT value FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+
+            self._db.execute(
+                "UPDATE responses SET accessed = ? WHERE key = ?", (time.time(), key)
+            )
+            self._db.commit()
+            self.hits += 1
+            return bytes(row[0])
+
+    def put(self, key: str, value: bytes) -> None:
+        """Store value under key, replacing any previous value."""
+        if len(value) > self.max_bytes:
+            return
+
+        now = time.time()
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses (key, value, size, created, accessed)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (key, value, len(value), now, now),
+            )
+            self._db.commit()
+
+    def size(self) -> int:
+        """Total size of stored values in bytes."""
+        with self._lock:
+            return self._db.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()[0]
+
+    def compact(self) -> int:
+        """
+        Delete least recently used rows until the store fits max_bytes.
+
+        Returns:
+            Number of rows deleted
+        """
+        with self._lock:
+            total = self._db.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()[0]
+            if total <= self.max_bytes:
+                return 0
+
+            deleted = 0
+            rows = self._db.execute(
+                "SELECT key, size FROM responses ORDER BY accessed"
+            ).fetchall()
+            for key, size in rows:
+                if total <= self.max_bytes:
+                    break
+                self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+                total -= size
+                deleted += 1
+
+            self._db.commit()
+            # execute() would step the pragma once, freeing a single page;
+            # executescript() runs it to completion
+            self._db.executescript("PRAGMA incremental_vacuum;")
+            return deleted
+
+    def stats(self) -> Dict[str, int]:
+        """Snapshot of the store counters and current size."""
+        return {"hits": self.hits, "misses": self.misses, "bytes": self.size()}
+
+    def close(self) -> None:
+        """Stop background compaction and close the database."""
+        self._closed.set()
+        with self._lock:
+            self._db.close()
+
+    def _compact_loop(self) -> None:
+        while not self._closed.wait(self.compact_interval):
+            try:
+                self.compact()
+            except sqlite3.Error as e:
+                if self._closed.is_set():
+                    return
+                # Imported here: node_base imports this module
+                from .node_base import console
+
+                console.print(f"[red]Response store compaction failed: {e}[/red]")
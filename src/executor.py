@@ -1,12 +1,197 @@
+import asyncio
+import heapq
+import multiprocessing
+import queue
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import AsyncIterator, Awaitable, Callable, Optional, Set
+
+from .cache import ResultCache
+from .graph import CycleError, ExecutionPlan, GraphIndex, Schedule, build_schedule
 from .nodes import *
+from .spool import release_spooled
+from .streams import END_OF_STREAM, UPSTREAM_FAILED, EdgeQueue, UpstreamFailed
+
+
+# Duration assumed for nodes that have never been executed (seconds)
+DEFAULT_NODE_DURATION = 1.0
+
+
+class PriorityGate:
+    """
+    Async semaphore that admits waiters highest priority first.
+
+    Shared by every component of a run, so a worker pool's slots go to
+    the most critical ready node across components instead of queueing
+    first-come first-served inside the pool.
+
+    Attributes:
+        limit (int): Slots available
+        busy (int): Slots currently held
+    """
+
+    def __init__(self, limit: int) -> None:
+        self.limit = limit
+        self.busy = 0
+        self._waiters = []
+        self._order = 0
+
+    def reserve(self, priority: float) -> "asyncio.Future":
+        """
+        Queue for a slot; higher priorities are admitted first.
+
+        Reserving is synchronous, so a scheduler can queue newly released
+        nodes before it frees the slot of the node that released them.
+
+        Returns:
+            Future resolved once the slot is granted (already resolved if
+            one is free)
+        """
+        future = asyncio.get_running_loop().create_future()
+        if self.busy < self.limit and not self._waiters:
+            self.busy += 1
+            future.set_result(None)
+        else:
+            self._order += 1
+            heapq.heappush(self._waiters, (-priority, self._order, future))
+        return future
+
+    def release(self) -> None:
+        """Hand the slot to the highest priority waiter, or free it."""
+        while self._waiters:
+            _, _, future = heapq.heappop(self._waiters)
+            if not future.done():
+                future.set_result(None)
+                return
+        self.busy -= 1
+
+
+@dataclass
+class NodeMetrics:
+    """Execution metrics for a node (or a node type)."""
+
+    execution_count: int = 0
+    total_execution_time: float = 0.0
+    last_execution_time: float = 0.0
+    error_count: int = 0
+
+    def record_execution(self, duration: float):
+        self.execution_count += 1
+        self.total_execution_time += duration
+        self.last_execution_time = duration
+
+    def record_error(self):
+        self.error_count += 1
+
+    @property
+    def avg_execution_time(self) -> float:
+        if self.execution_count == 0:
+            return 0.0
+        return self.total_execution_time / self.execution_count
+
+
+class Executor(object):
+    """
+    Background service that runs workflow executions and records their traces.
 
-class Executor(object): 
-    def __init__(self):
+    Data flows between nodes as items (dicts): a node runs once per input
+    item (or once per batch, see NodeBase.batch_size), and its output items
+    become the input items of its children. In streaming mode every node
+    of the run starts at once and consumes items from its upstream edges as
+    they arrive, so generator nodes feed their children incrementally.
+    Outputs are kept between runs: the application only submits dirty
+    nodes, and clean upstream nodes contribute their last outputs.
+
+    Run requests are queued by the caller and picked up by a dispatcher
+    thread, which drives each run from an asyncio event loop. Execution is
+    dependency driven: every node keeps a counter of unfinished upstream
+    nodes and is dispatched as soon as that counter reaches zero, without
+    waiting for unrelated nodes. Nodes implementing a native aexecute()
+    share the event loop; synchronous execute() nodes run according to
+    their execution mode: inline on the loop, on a bounded thread pool, or
+    serialized to a process pool for CPU-bound work.
+    When more nodes are ready than there are free workers, the node with the
+    longest remaining critical path (weighted by recorded durations) goes
+    first. Status changes are published to subscribers (see subscribe()), so
+    the executor runs the same with or without an editor attached.
+
+    Attributes:
+        max_workers (int): Upper bound on synchronous nodes run concurrently
+        max_processes (int): Size of the process pool for "process" nodes
+        max_concurrency (int): Upper bound on all nodes in flight at once
+        streaming (bool): Whether runs use the streaming pipeline
+        edge_capacity (int): Per-edge queue capacity in streaming mode
+        retain_outputs (bool): Whether streaming runs record the outputs of
+            nodes feeding other nodes of the run
+        result_cache (ResultCache): Content-addressed cache of node results
+        execution_array (List[Dict]): Completed execution records
+        execution (Dict): Execution record currently being built
+        node_inputs (Dict[str, List[Dict]]): Last input items per node id
+            (not recorded by streaming runs)
+        node_outputs (Dict[str, List[Dict]]): Last output items per node id
+        source_items (Optional[List[Dict]]): Input items of the current run's
+            root nodes (None runs each root once on an empty item)
+        metrics (Dict[str, NodeMetrics]): Recorded metrics per node id
+        type_metrics (Dict[str, NodeMetrics]): Recorded metrics per node type
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        max_concurrency: int = 1024,
+        max_processes: Optional[int] = None,
+        streaming: bool = False,
+        edge_capacity: int = 64,
+        result_cache: Optional[ResultCache] = None,
+        retain_outputs: bool = True,
+    ):
+        """
+        Initialize the executor.
+
+        Args:
+            max_workers: Size of the thread pool for synchronous nodes. Defaults
+                to the same heuristic as ThreadPoolExecutor (cpu count + 4, max 32)
+            max_concurrency: Maximum nodes in flight, including async nodes
+                waiting on the event loop
+            max_processes: Size of the process pool used by nodes in
+                "process" mode. Defaults to the cpu count
+            streaming: Run workflows as a streaming pipeline where all nodes
+                start together and items flow downstream as they are produced
+            edge_capacity: Items buffered per edge in streaming mode before
+                the producer is suspended (0 for unbounded)
+            result_cache: Cache shared by cacheable nodes. Defaults to a new
+                in-memory ResultCache
+            retain_outputs: In streaming mode, record the outputs of every
+                node so later runs can reuse them. When False, only nodes
+                with no downstream node in the run keep theirs; the others
+                forward their items and stay stale, which bounds a run's
+                memory by the edge capacities. Batch runs always record
+                outputs, since downstream nodes read them from there
+        """
+        self.max_workers = max_workers or min(32, (os.cpu_count() or 1) + 4)
+        self.max_processes = max_processes or os.cpu_count() or 1
+        self.streaming = streaming
+        self.edge_capacity = edge_capacity
+        self.retain_outputs = retain_outputs
+        self.result_cache = result_cache if result_cache is not None else ResultCache()
+        self.max_concurrency = max(max_concurrency, self.max_workers)
         self.execution_array = []
         self.execution = {}
         self.node_inputs = {}
         self.node_outputs = {}
+        self.source_items: Optional[List[Dict[str, Any]]] = None
         self.connections = {}
+        self.graph_plan: Optional[ExecutionPlan] = None
+        self.nodes = {}
+        self.metrics: Dict[str, NodeMetrics] = {}
+        self.type_metrics: Dict[str, NodeMetrics] = {}
+        self._traces_lock = threading.Lock()
+        self._requests = queue.Queue()
+        self._subscribers: List[Callable[[str, str], None]] = []
+        self._dispatcher = None
+        self._process_pool = None
+        self._edges: List[EdgeQueue] = []
 
     def set_node_input(self, id, item):
         if id in self.node_inputs:
@@ -16,25 +201,401 @@ class Executor(object):
         if id in self.node_outputs:
             self.node_outputs[id].append(item)
 
-    def set_exec_status(self, node_id, color, status):
+    def subscribe(self, callback: Callable[[str, str], None]) -> None:
+        """
+        Register a listener for node status events.
 
-        self.nodes[node_id].status = status
+        Callbacks run on the executor's threads with (node_id, status);
+        views that are not thread-safe should queue the event and apply
+        it on their own thread. An exception raised by a callback is
+        logged and never fails the node.
 
-        dpg.set_value(item=f"{node_id}_exec_status", value=status)
-        dpg.configure_item(
-            item=f"{node_id}_exec_status",
-            color=color,
-        )
-        if status == "RUNNING":
-            dpg.configure_item(
-                item=f"{node_id}_loading",
-                show=True,
-                color=color,
+        Args:
+            callback: Called for every status change
+        """
+        self._subscribers.append(callback)
+
+    def unsubscribe(self, callback: Callable[[str, str], None]) -> None:
+        """Remove a listener registered with subscribe()."""
+        self._subscribers.remove(callback)
+
+    def post_status(self, node_id: str, status: str) -> None:
+        """
+        Publish a node status change (RUNNING, COMPLETED, ERROR).
+
+        Records the status on the node and notifies every subscriber.
+        Safe to call from any thread.
+        """
+        node = self.nodes.get(node_id)
+        if node is not None:
+            node.status = status
+        for callback in list(self._subscribers):
+            # A failing listener must not turn into the node's failure
+            try:
+                callback(node_id, status)
+            except Exception as e:
+                console.print(f"[red]Status listener failed for {node_id}: {e}[/red]")
+
+    def submit(
+        self,
+        node_ids: List[str],
+        nodes,
+        connections,
+        inputs: Optional[List[Dict[str, Any]]] = None,
+        plan: Optional[ExecutionPlan] = None,
+    ) -> None:
+        """
+        Queue a workflow run for the background dispatcher.
+
+        Args:
+            node_ids: Node ids to execute
+            nodes: Nodes taking part in the execution
+            connections: Incoming connections (target id -> source ids)
+            inputs: Input items for the root nodes (default: one empty item)
+            plan: Compiled plan of the graph; its memoized schedules replace
+                rebuilding the run's adjacency from connections
+        """
+        if self._dispatcher is None:
+            self._dispatcher = threading.Thread(
+                target=self._dispatch, name="lighthouse-dispatcher", daemon=True
             )
-        else:
-            dpg.configure_item(item=f"{node_id}_loading", show=False)
+            self._dispatcher.start()
+
+        self._requests.put((node_ids, nodes, connections, inputs, plan))
+
+    def join(self) -> None:
+        """Block until every queued run has finished."""
+        self._requests.join()
+
+    def _dispatch(self) -> None:
+        """Run queued requests one after another (dispatcher thread)."""
+        while True:
+            node_ids, nodes, connections, inputs, plan = self._requests.get()
+            try:
+                self.run(node_ids, nodes, connections, inputs, plan)
+            except Exception:
+                console.print_exception()
+            finally:
+                self._requests.task_done()
+
+    def execution_mode(self, node_id: str) -> str:
+        """
+        Resolve how a node will be executed.
+
+        Returns:
+            "async" for nodes with a native aexecute(), otherwise the
+            node's ExecutionMode value ("inline", "thread" or "process")
+        """
+        node = self.nodes[node_id]
+        if node.has_native_async:
+            return "async"
+        return ExecutionMode(node.execution_mode).value
+
+    def _get_process_pool(self) -> ProcessPoolExecutor:
+        """Create the process pool on first use and keep it across runs."""
+        if self._process_pool is None:
+            # Spawn rather than fork: the parent runs GUI and worker threads
+            self._process_pool = ProcessPoolExecutor(
+                max_workers=self.max_processes,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._process_pool
+
+    def shutdown(self) -> None:
+        """Release the process pool, if one was started."""
+        if self._process_pool is not None:
+            self._process_pool.shutdown(cancel_futures=True)
+            self._process_pool = None
+
+    def mark_dirty(
+        self, node_id: str, nodes: Dict[str, Any], graph: GraphIndex
+    ) -> None:
+        """
+        Mark a node and all of its descendants dirty.
 
-    def create_execution(self, nodes, connections):
+        Dirty nodes are re-executed on the next run; clean nodes keep
+        their last outputs, which are reused as inputs downstream.
+
+        Args:
+            node_id: Node whose configuration or inputs changed
+            nodes: Live nodes by id
+            graph: Index of the node graph
+        """
+        for current in self.descendants(node_id, nodes, graph):
+            nodes[current].mark_stale()
+
+    def descendants(
+        self, node_id: str, nodes: Dict[str, Any], graph: GraphIndex
+    ) -> Set[str]:
+        """
+        Collect a node and every node reachable downstream of it.
+
+        Args:
+            node_id: Node to start from
+            nodes: Live nodes by id
+            graph: Index of the node graph
+
+        Returns:
+            Set of node ids, including node_id
+        """
+        stack = [node_id]
+        seen = set()
+        while stack:
+            current = stack.pop()
+            if current in seen or current not in nodes:
+                continue
+            seen.add(current)
+            stack.extend(graph.successors(current))
+        return seen
+
+    def is_stale(self, node_id: str, nodes: Dict[str, Any]) -> bool:
+        """A node must run if it is dirty or has no recorded outputs."""
+        return nodes[node_id].is_dirty or node_id not in self.node_outputs
+
+    def plan(self, node_id: str, nodes: Dict[str, Any], graph: GraphIndex) -> Set[str]:
+        """
+        Select the nodes a run triggered from node_id has to execute.
+
+        The run always covers node_id and every node downstream of it, so
+        a trigger or a poll can be fired again without editing a field.
+        Their stale ancestors, whose outputs the run needs, are added
+        transitively; up-to-date ancestors are reused instead of executed,
+        and nodes outside that subgraph are never visited.
+
+        Args:
+            node_id: Node the run was triggered from
+            nodes: Live nodes by id
+            graph: Index of the node graph
+
+        Returns:
+            Set of node ids to execute (empty if everything is up to date)
+        """
+        selected = self.descendants(node_id, nodes, graph)
+        stack = [
+            parent_id
+            for current in selected
+            for parent_id in graph.predecessors(current)
+        ]
+        while stack:
+            current = stack.pop()
+            if (
+                current in selected
+                or current not in nodes
+                or not self.is_stale(current, nodes)
+            ):
+                continue
+            selected.add(current)
+            stack.extend(graph.predecessors(current))
+        return selected
+
+    def forget(self, node_id: str) -> None:
+        """Drop the recorded inputs, outputs and metrics of a deleted node."""
+        self.node_inputs.pop(node_id, None)
+        self.drop_outputs(node_id)
+        self.metrics.pop(node_id, None)
+
+    def drop_outputs(
+        self, node_id: str, replacement: Optional[List[Dict[str, Any]]] = None
+    ) -> None:
+        """
+        Discard a node's recorded outputs and the spool files behind them.
+
+        Args:
+            node_id: Node whose outputs are superseded
+            replacement: New outputs; spool files they still refer to
+                are kept
+        """
+        outputs = self.node_outputs.pop(node_id, None)
+        if outputs:
+            release_spooled(outputs, replacement or [])
+
+    def gather_inputs(self, node_id: str) -> List[Dict[str, Any]]:
+        """
+        Collect a node's input items from its upstream nodes' outputs.
+
+        Nodes without upstream connections receive the run's source items,
+        or a single empty item so they execute once. Outputs of upstream
+        nodes that did not run in this execution are taken from their
+        last run.
+        """
+        upstream = self.connections.get(node_id, [])
+        if not upstream:
+            return self.root_items()
+
+        items = []
+        for source_id in upstream:
+            items.extend(self.node_outputs.get(source_id, []))
+        return items
+
+    def root_items(self) -> List[Dict[str, Any]]:
+        """Input items of root nodes in the current run."""
+        if self.source_items is None:
+            return [{}]
+        return list(self.source_items)
+
+    async def _execute_step(
+        self, node_id: str, mode: str, pools: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Execute a single node over its input items, posting its status.
+
+        Native async nodes are awaited on the event loop and "inline" nodes
+        are called on it directly. "thread" nodes run on the thread pool and
+        "process" nodes are serialized (state and inputs) to the process
+        pool, so neither blocks the loop.
+
+        Returns:
+            Item counts and the node's trace_fields() for the execution trace
+        """
+        node = self.nodes[node_id]
+        version = node.edit_version
+        self.post_status(node_id, "RUNNING")
+
+        items = self.gather_inputs(node_id)
+        self.node_inputs[node_id] = []
+        for item in items:
+            self.set_node_input(node_id, item)
+
+        try:
+            loop = asyncio.get_running_loop()
+            if mode == "async":
+                outputs = await node.arun_items(items)
+            elif mode == "inline":
+                outputs = node.run_items(items)
+            elif mode == "process":
+                outputs = await loop.run_in_executor(
+                    pools["process"], execute_serialized, node.serialize(), items
+                )
+            else:
+                outputs = await loop.run_in_executor(
+                    pools["thread"], node.run_items, items
+                )
+        except Exception:
+            self.drop_outputs(node_id)
+            self.post_status(node_id, "ERROR")
+            raise
+
+        self.drop_outputs(node_id, outputs)
+        self.node_outputs[node_id] = []
+        for item in outputs:
+            self.set_node_output(node_id, item)
+        # Stays dirty if it was edited or relinked while running
+        node.mark_clean(version)
+        self.post_status(node_id, "COMPLETED")
+        trace = {"items_in": len(items), "items_out": len(outputs)}
+        trace.update(node.trace_fields(outputs))
+        return trace
+
+    def run(
+        self,
+        node_ids: List[str],
+        nodes,
+        connections,
+        inputs: Optional[List[Dict[str, Any]]] = None,
+        plan: Optional[ExecutionPlan] = None,
+    ) -> None:
+        """
+        Execute a workflow run (blocking).
+
+        Args:
+            node_ids: Node ids to execute, in topological order
+            nodes: Nodes taking part in the execution
+            connections: Incoming connections (target id -> source ids)
+            inputs: Input items for the root nodes (default: one empty item)
+            plan: Compiled plan of the graph (see submit)
+        """
+        self.source_items = inputs
+        self.connections = connections
+        self.graph_plan = plan
+        self.nodes = {node.id: node for node in nodes}
+        for node in nodes:
+            node.result_cache = self.result_cache
+        asyncio.run(self.arun(node_ids))
+
+    def schedule(self, node_ids: List[str]) -> Schedule:
+        """
+        Adjacency of node_ids restricted to the run.
+
+        Taken from the run's compiled plan, which memoizes it per set of
+        nodes, so repeated runs of an unchanged graph skip this step;
+        built from connections when the run has no plan.
+
+        Args:
+            node_ids: Node ids, in topological order
+        """
+        if self.graph_plan is not None:
+            return self.graph_plan.schedule(node_ids)
+        return build_schedule(node_ids, self.connections)
+
+    def components(self, node_ids: List[str]) -> List[List[str]]:
+        """
+        Split node ids into weakly connected components.
+
+        Args:
+            node_ids: Node ids, in topological order
+
+        Returns:
+            Components in order of their first node, each keeping the
+            topological order of node_ids
+        """
+        return self.schedule(node_ids).components
+
+    async def arun(self, node_ids: List[str]) -> None:
+        """
+        Execute a workflow run on the running event loop.
+
+        Each weakly connected component of node_ids is independent of the
+        others, so each runs concurrently as its own execution with its
+        own record in execution_array. Components share the worker pools.
+
+        Args:
+            node_ids: Node ids to execute, in topological order
+        """
+        self._edges = []
+        with ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="lighthouse"
+        ) as thread_pool:
+            pools = self._new_pools(thread_pool)
+            # A component is closed under the run's links: it can be
+            # scheduled with the run's adjacency as is
+            schedule = self.schedule(node_ids)
+            await asyncio.gather(
+                *(
+                    self._arun_component(component, pools, schedule)
+                    for component in schedule.components
+                )
+            )
+
+    def _new_pools(self, thread_pool: ThreadPoolExecutor) -> Dict[str, Any]:
+        """
+        Worker pools for a run, with the priority gates bounding them.
+
+        The process pool is added on first use by a process node.
+        """
+        return {
+            "thread": thread_pool,
+            "gates": {
+                "thread": PriorityGate(self.max_workers),
+                "process": PriorityGate(self.max_processes),
+            },
+        }
+
+    async def _arun_component(
+        self, node_ids: List[str], pools: Dict[str, Any], schedule: Schedule
+    ) -> None:
+        """Execute one connected component as its own execution."""
+        execution = self.create_execution(
+            [self.nodes[node_id] for node_id in node_ids], self.connections
+        )
+        try:
+            if self.streaming:
+                await self.astream_graph(node_ids, execution, pools, schedule)
+            else:
+                await self.aexecute_graph(node_ids, execution, pools, schedule)
+        finally:
+            self.end_execution(execution)
+
+    def create_execution(self, nodes, connections) -> Dict[str, Any]:
         self.execution = {
             "id": str(uuid.uuid4())[-8:],
             "nodes": nodes,
@@ -43,23 +604,588 @@ class Executor(object):
             "outputs": {},
             "createdAt": time.time(),
             "endedAt": None,
-            "traces":[]
+            "traces":[],
+            # Counters at the start; end_execution() keeps the difference
+            "cache": self.result_cache.stats(),
         }
-        self.connections = connections
-        console.print("Created Execution")
-        console.print(self.execution)
-        console.print(self.connections)
-        self.begin_execution()
-
-    def end_execution(self):
-        self.execution['endedAt'] = time.time()
-        self.execution["inputs"] = self.node_inputs
-        self.execution["outputs"] = self.node_outputs
-        self.execution_array.append(self.execution)
-        console.print(self.execution_array)
-
-    def begin_execution(self):
-        console.print("Starting Execution")
-        nodes = self.execution['nodes']
-        for node in nodes:
-            console.print(node)
+        self.begin_execution(self.execution)
+        return self.execution
+
+    def end_execution(self, execution: Dict[str, Any]):
+        execution['endedAt'] = time.time()
+        executed = [trace["node_id"] for trace in execution["traces"]]
+        execution["inputs"] = {
+            nid: self.node_inputs[nid] for nid in executed if nid in self.node_inputs
+        }
+        execution["outputs"] = {
+            nid: self.node_outputs[nid] for nid in executed if nid in self.node_outputs
+        }
+        # Lookups by executions running concurrently (other components)
+        # fall in the same window and are counted by each of them
+        start, end = execution["cache"], self.result_cache.stats()
+        execution["cache"] = {
+            key: end[key] - start[key] for key in ("hits", "misses", "evictions")
+        }
+        execution["cache"].update(entries=end["entries"], bytes=end["bytes"])
+        with self._traces_lock:
+            self.execution_array.append(execution)
+        # Runs on the event loop: rendering is skipped entirely when quiet
+        if not console.quiet:
+            elapsed = execution["endedAt"] - execution["createdAt"]
+            console.print(
+                f"Execution {execution['id']} finished: "
+                f"{len(executed)}/{len(execution['nodes'])} node(s) in {elapsed:.2f}s"
+            )
+
+    def begin_execution(self, execution: Dict[str, Any]):
+        if not console.quiet:
+            console.print(
+                f"Starting execution {execution['id']} "
+                f"({len(execution['nodes'])} node(s))"
+            )
+
+    def execute_graph(self, node_ids: List[str]) -> None:
+        """
+        Execute node ids in dependency order (blocking).
+
+        Runs aexecute_graph on a fresh event loop; see there for details.
+
+        Args:
+            node_ids: Node ids to execute, in topological order
+        """
+        asyncio.run(self.aexecute_graph(node_ids))
+
+    async def aexecute_graph(
+        self,
+        node_ids: List[str],
+        execution: Optional[Dict[str, Any]] = None,
+        pools: Optional[Dict[str, Any]] = None,
+        schedule: Optional[Schedule] = None,
+    ) -> None:
+        """
+        Execute node ids in dependency order on the running event loop.
+
+        Each node tracks how many of its upstream nodes (within node_ids)
+        are still unfinished and becomes ready the moment the last one
+        completes. Upstream nodes outside node_ids count as satisfied.
+        Ready nodes are dispatched by critical-path priority (see
+        critical_path_priorities) while at most max_workers thread nodes,
+        max_processes process nodes and max_concurrency nodes overall are
+        in flight.
+        Descendants of a failed node are never released and are skipped.
+
+        Args:
+            node_ids: Node ids to execute, in topological order
+            execution: Execution record receiving the traces (default:
+                the current execution)
+            pools: Worker pools shared with concurrent executions (default:
+                a thread pool owned by this call)
+            schedule: Adjacency covering node_ids (default: see schedule())
+        """
+        if pools is None:
+            with ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="lighthouse"
+            ) as thread_pool:
+                await self.aexecute_graph(
+                    node_ids, execution, self._new_pools(thread_pool), schedule
+                )
+            return
+        if execution is None:
+            execution = self.execution
+
+        if schedule is None:
+            schedule = self.schedule(node_ids)
+        in_degree = {node_id: len(schedule.upstream[node_id]) for node_id in node_ids}
+        outgoing = schedule.downstream
+
+        # Recomputed every run: estimates follow the recorded durations
+        priority = self.critical_path_priorities(node_ids, outgoing)
+
+        # Max-heap on priority; insertion order breaks ties
+        ready = []
+        for order, node_id in enumerate(node_ids):
+            if in_degree[node_id] == 0:
+                heapq.heappush(ready, (-priority[node_id], order, node_id))
+        order = len(node_ids)
+        finished = 0
+
+        running = {}
+        released = []
+        while ready or running:
+            # Dispatch by priority; pooled nodes then queue at the run's
+            # shared gate, which admits the most critical node across
+            # components whenever a worker frees up
+            while ready and len(running) < self.max_concurrency:
+                neg_priority, _, node_id = heapq.heappop(ready)
+                mode = self.execution_mode(node_id)
+                if mode == "process" and "process" not in pools:
+                    pools["process"] = self._get_process_pool()
+                gate = pools["gates"].get(mode)
+                admitted = gate.reserve(-neg_priority) if gate is not None else None
+                task = asyncio.create_task(
+                    self._execute_admitted(node_id, mode, admitted, pools, execution)
+                )
+                running[task] = (node_id, gate)
+
+            # Free finished nodes' workers only now, after their children
+            # were queued, so the children compete for them by priority
+            for gate in released:
+                gate.release()
+            released = []
+
+            done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                node_id, gate = running.pop(task)
+                if gate is not None:
+                    released.append(gate)
+                finished += 1
+                if not task.result():
+                    continue
+
+                # Release children whose last upstream just finished
+                for child_id in outgoing[node_id]:
+                    in_degree[child_id] -= 1
+                    if in_degree[child_id] == 0:
+                        order += 1
+                        heapq.heappush(ready, (-priority[child_id], order, child_id))
+
+        for gate in released:
+            gate.release()
+
+        if finished < len(node_ids):
+            console.print(
+                f"[yellow]Skipped {len(node_ids) - finished} node(s) "
+                f"downstream of a failure[/yellow]"
+            )
+
+    def stream_graph(self, node_ids: List[str]) -> None:
+        """
+        Execute node ids as a streaming pipeline (blocking).
+
+        Runs astream_graph on a fresh event loop; see there for details.
+
+        Args:
+            node_ids: Node ids to execute, in topological order
+        """
+        asyncio.run(self.astream_graph(node_ids))
+
+    async def astream_graph(
+        self,
+        node_ids: List[str],
+        execution: Optional[Dict[str, Any]] = None,
+        pools: Optional[Dict[str, Any]] = None,
+        schedule: Optional[Schedule] = None,
+    ) -> None:
+        """
+        Execute node ids as a streaming pipeline on the running event loop.
+
+        Every node starts immediately and reads items from one bounded
+        queue per upstream edge as producers emit them, so the first
+        results reach the end of the pipeline without waiting for whole
+        stages to finish, while a full queue suspends its producer.
+        Thread and process nodes still share the bounded pools. Final
+        queue gauges are stored on the execution under "queues".
+        A failed node ends its output streams with a failure marker and
+        its descendants stop without running further items.
+
+        Args:
+            node_ids: Node ids to execute, in topological order
+            execution: Execution record receiving the traces and queue
+                gauges (default: the current execution)
+            pools: Worker pools shared with concurrent executions (default:
+                a thread pool owned by this call)
+            schedule: Adjacency covering node_ids (default: see schedule())
+        """
+        if pools is None:
+            self._edges = []
+            with ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="lighthouse"
+            ) as thread_pool:
+                await self.astream_graph(
+                    node_ids, execution, self._new_pools(thread_pool), schedule
+                )
+            return
+        if execution is None:
+            execution = self.execution
+
+        if schedule is None:
+            schedule = self.schedule(node_ids)
+        run_set = set(node_ids)
+        inbound = {node_id: [] for node_id in node_ids}
+        outbound = {node_id: [] for node_id in node_ids}
+        edges = []
+        for node_id in node_ids:
+            for source_id in schedule.upstream[node_id]:
+                edge = EdgeQueue(source_id, node_id, self.edge_capacity)
+                outbound[source_id].append(edge)
+                inbound[node_id].append(edge)
+                edges.append(edge)
+        self._edges.extend(edges)
+
+        if "process" not in pools and any(
+            self.execution_mode(nid) == "process" for nid in node_ids
+        ):
+            pools["process"] = self._get_process_pool()
+
+        results = await asyncio.gather(
+            *(
+                self._execute_traced(
+                    node_id,
+                    self.execution_mode(node_id),
+                    self._stream_step(
+                        node_id,
+                        self.execution_mode(node_id),
+                        pools,
+                        inbound[node_id],
+                        outbound[node_id],
+                        run_set,
+                    ),
+                    execution,
+                )
+                for node_id in node_ids
+            )
+        )
+
+        execution["queues"] = [edge.gauge() for edge in edges]
+
+        skipped = sum(
+            1
+            for node_id, ok in zip(node_ids, results)
+            if not ok and self.nodes[node_id].status != "ERROR"
+        )
+        if skipped:
+            console.print(
+                f"[yellow]Stopped {skipped} node(s) downstream of a failure[/yellow]"
+            )
+
+    async def _stream_inputs(
+        self, node_id: str, inbound: List[EdgeQueue], run_set: set
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yield a node's input items in arrival order.
+
+        Outputs of upstream nodes outside this run are replayed first, then
+        items from every inbound edge are merged until each edge has ended.
+        Nodes without any upstream receive the run's root items.
+
+        Raises:
+            UpstreamFailed: When a producer ends its stream with a failure
+        """
+        upstream = self.connections.get(node_id, [])
+        if not upstream:
+            for item in self.root_items():
+                yield item
+            return
+
+        for source_id in upstream:
+            if source_id not in run_set:
+                for item in self.node_outputs.get(source_id, []):
+                    yield item
+
+        pending = {asyncio.ensure_future(edge.get()): edge for edge in inbound}
+        try:
+            while pending:
+                done, _ = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for future in done:
+                    edge = pending.pop(future)
+                    item = future.result()
+                    if item is UPSTREAM_FAILED:
+                        raise UpstreamFailed(node_id)
+                    if item is END_OF_STREAM:
+                        continue
+                    pending[asyncio.ensure_future(edge.get())] = edge
+                    yield item
+        finally:
+            for future in pending:
+                future.cancel()
+
+    async def _stream_step(
+        self,
+        node_id: str,
+        mode: str,
+        pools: Dict[str, Any],
+        inbound: List[EdgeQueue],
+        outbound: List[EdgeQueue],
+        run_set: set,
+    ) -> Dict[str, Any]:
+        """
+        Run one node of a streaming pipeline.
+
+        Each input item is executed as soon as it arrives and every output
+        item is forwarded to all outbound edges immediately. Nodes with a
+        batch_size other than 1 collect that many items before executing.
+
+        Input items are only kept while the node's fields reference
+        $input (whose all(), first() and last() need the items seen so
+        far), and outputs only if retain_outputs is set or nothing in
+        the run consumes them, so items otherwise live no longer than
+        their edge queues hold them.
+
+        Returns:
+            Item counts and time to first output for the execution trace
+        """
+        node = self.nodes[node_id]
+        version = node.edit_version
+        loop = asyncio.get_running_loop()
+        started = time.time()
+        first_output = None
+        keep_inputs = node.references_inputs()
+        keep_outputs = self.retain_outputs or not outbound
+        items = []
+        outputs = []
+        items_in = 0
+        items_out = 0
+        fields = {}
+
+        async def emit(output_items):
+            nonlocal first_output, items_out
+            if not keep_outputs:
+                # Outputs are not kept for trace_fields(): sum per chunk
+                for key, value in node.trace_fields(output_items).items():
+                    fields[key] = fields.get(key, 0) + value
+            for output in output_items:
+                if first_output is None:
+                    first_output = time.time() - started
+                items_out += 1
+                if keep_outputs:
+                    outputs.append(output)
+                for edge in outbound:
+                    await edge.put(output)
+
+        async def run_batch(batch):
+            if mode == "async":
+                await emit(await node.aexecute_batch(batch, items))
+            elif mode == "inline":
+                await emit(node.execute_batch(batch, items))
+            elif mode == "process":
+                await emit(
+                    await loop.run_in_executor(
+                        pools["process"], execute_serialized, node.serialize(), batch
+                    )
+                )
+            else:
+                await emit(
+                    await loop.run_in_executor(
+                        pools["thread"], node.execute_batch, batch, items
+                    )
+                )
+
+        async def run_item(item):
+            if mode == "async":
+                async for output in node.aiter_item(item, items):
+                    await emit([output])
+            elif mode == "inline":
+                for output in node.iter_item(item, items):
+                    await emit([output])
+            elif mode == "process":
+                await run_batch([item])
+            else:
+                generator = node.iter_item(item, items)
+                while True:
+                    output = await loop.run_in_executor(
+                        pools["thread"], next, generator, END_OF_STREAM
+                    )
+                    if output is END_OF_STREAM:
+                        break
+                    await emit([output])
+
+        self.post_status(node_id, "RUNNING")
+        try:
+            batch = []
+            async for item in self._stream_inputs(node_id, inbound, run_set):
+                items_in += 1
+                if keep_inputs:
+                    items.append(item)
+                else:
+                    items = [item]
+                if node.batch_size == 1:
+                    await run_item(item)
+                    continue
+                batch.append(item)
+                if node.batch_size > 1 and len(batch) >= node.batch_size:
+                    await run_batch(batch)
+                    batch = []
+            if batch:
+                await run_batch(batch)
+        except UpstreamFailed:
+            self.post_status(node_id, "PENDING")
+            self._stop_streams(inbound)
+            await self._close_streams(outbound, UPSTREAM_FAILED)
+            raise
+        except Exception:
+            self.drop_outputs(node_id)
+            self.post_status(node_id, "ERROR")
+            self._stop_streams(inbound)
+            await self._close_streams(outbound, UPSTREAM_FAILED)
+            raise
+
+        await self._close_streams(outbound, END_OF_STREAM)
+        self.node_inputs.pop(node_id, None)
+        self.drop_outputs(node_id, outputs)
+        if keep_outputs:
+            self.node_outputs[node_id] = outputs
+            fields = node.trace_fields(outputs)
+        # Stays dirty if it was edited or relinked while running (and
+        # stale anyway without recorded outputs)
+        node.mark_clean(version)
+        self.post_status(node_id, "COMPLETED")
+        trace = {
+            "items_in": items_in,
+            "items_out": items_out,
+            "first_output": first_output,
+        }
+        trace.update(fields)
+        return trace
+
+    async def _close_streams(self, outbound: List[EdgeQueue], marker) -> None:
+        """Send an end-of-stream or failure marker on every outbound edge."""
+        for edge in outbound:
+            await edge.put(marker)
+
+    def _stop_streams(self, inbound: List[EdgeQueue]) -> None:
+        """Close inbound edges of a node that stopped reading early."""
+        for edge in inbound:
+            edge.close()
+
+    def queue_gauges(self) -> List[Dict[str, Any]]:
+        """
+        Report queue statistics for the edges of the latest streaming run.
+
+        Each entry holds the edge's source and target ids, capacity,
+        current depth, high-water mark, items passed, time the producer
+        spent blocked and whether the queue ever filled up.
+        """
+        return [edge.gauge() for edge in list(self._edges)]
+
+    def estimate_duration(self, node_id: str) -> float:
+        """
+        Estimate how long a node will take from recorded metrics.
+
+        Falls back to the average of the node's type, then to
+        DEFAULT_NODE_DURATION for nodes that were never executed.
+        """
+        metrics = self.metrics.get(node_id)
+        if metrics and metrics.execution_count:
+            return metrics.avg_execution_time
+
+        node = self.nodes.get(node_id)
+        if node is not None:
+            metrics = self.type_metrics.get(type(node).__name__)
+            if metrics and metrics.execution_count:
+                return metrics.avg_execution_time
+
+        return DEFAULT_NODE_DURATION
+
+    def critical_path_priorities(
+        self, node_ids: List[str], outgoing: Dict[str, List[str]]
+    ) -> Dict[str, float]:
+        """
+        Compute each node's longest remaining path to a sink.
+
+        The priority of a node is its own estimated duration plus the
+        largest priority among its children, so nodes heading the longest
+        chain of work are started first.
+
+        Args:
+            node_ids: Node ids in topological order
+            outgoing: Children of each node within node_ids
+
+        Returns:
+            Mapping of node id to remaining critical path length (seconds)
+        """
+        priority = {}
+        for node_id in reversed(node_ids):
+            downstream = max(
+                (priority[child_id] for child_id in outgoing[node_id]), default=0.0
+            )
+            priority[node_id] = self.estimate_duration(node_id) + downstream
+        return priority
+
+    async def _execute_admitted(
+        self,
+        node_id: str,
+        mode: str,
+        admitted: Optional["asyncio.Future"],
+        pools: Dict[str, Any],
+        execution: Dict[str, Any],
+    ) -> bool:
+        """
+        Wait until the node's pool slot is granted, then execute and trace it.
+
+        Timing starts once the slot is granted, so waiting for a worker is
+        not recorded as node duration. The caller releases the slot.
+
+        Args:
+            admitted: Future from PriorityGate.reserve() (None if the mode
+                is not bounded by a pool)
+
+        Returns:
+            True if the node completed, False if it raised
+        """
+        if admitted is not None:
+            await admitted
+        return await self._execute_traced(
+            node_id, mode, self._execute_step(node_id, mode, pools), execution
+        )
+
+    async def _execute_traced(
+        self,
+        node_id: str,
+        mode: str,
+        step: Awaitable[Optional[Dict[str, Any]]],
+        execution: Dict[str, Any],
+    ) -> bool:
+        """
+        Await a node's execution step and append its trace to the execution.
+
+        Args:
+            node_id: Node being executed
+            mode: Execution mode recorded in the trace
+            step: Coroutine executing the node; may return extra trace fields
+            execution: Execution record receiving the trace
+
+        Returns:
+            True if the node completed, False if it raised
+        """
+        start_time = time.time()
+        error = None
+        extra = None
+        try:
+            extra = await step
+        except UpstreamFailed:
+            # Not this node's failure: no metrics, no trace
+            return False
+        except Exception as e:
+            error = str(e)
+            console.print(f"[red]Node {node_id} failed: {e}[/red]")
+        end_time = time.time()
+        duration = end_time - start_time
+
+        with self._traces_lock:
+            node_type = type(self.nodes[node_id]).__name__
+            for metrics in (
+                self.metrics.setdefault(node_id, NodeMetrics()),
+                self.type_metrics.setdefault(node_type, NodeMetrics()),
+            ):
+                if error is None:
+                    metrics.record_execution(duration)
+                else:
+                    metrics.record_error()
+
+        trace = {
+            "node_id": node_id,
+            "mode": mode,
+            "start": start_time - execution["createdAt"],
+            "end": end_time - execution["createdAt"],
+            "duration": duration,
+            "success": error is None,
+            "error": error,
+        }
+        if extra:
+            trace.update(extra)
+        with self._traces_lock:
+            execution["traces"].append(trace)
+
+        return error is None
@@ -0,0 +1,378 @@
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+# Schedules memoized per plan (one per distinct set of scheduled nodes)
+MAX_SCHEDULES = 32
+
+
+class CycleError(Exception):
+    """Raised when a link would make the node graph cyclic."""
+
+
+@dataclass
+class Schedule:
+    """
+    Adjacency of a set of scheduled nodes, restricted to that set.
+
+    Attributes:
+        order (List[str]): Node ids in topological order
+        upstream (Dict[str, List[str]]): Node id -> scheduled upstream ids
+        downstream (Dict[str, List[str]]): Node id -> scheduled downstream ids
+        components (List[List[str]]): Weakly connected components, in
+            order of their first node, each in topological order
+    """
+
+    order: List[str]
+    upstream: Dict[str, List[str]]
+    downstream: Dict[str, List[str]]
+    components: List[List[str]]
+
+
+def build_schedule(
+    node_ids: List[str],
+    predecessors: Dict[str, List[str]],
+    successors: Optional[Dict[str, List[str]]] = None,
+) -> Schedule:
+    """
+    Restrict a graph's adjacency to node_ids and split it into components.
+
+    Args:
+        node_ids: Node ids to schedule, in topological order
+        predecessors: Node id -> upstream node ids
+        successors: Node id -> downstream node ids (derived from
+            predecessors if omitted)
+
+    Returns:
+        Schedule of node_ids
+    """
+    run_set = set(node_ids)
+    upstream = {
+        node_id: [src for src in predecessors.get(node_id, []) if src in run_set]
+        for node_id in node_ids
+    }
+    if successors is not None:
+        downstream = {
+            node_id: [dst for dst in successors.get(node_id, []) if dst in run_set]
+            for node_id in node_ids
+        }
+    else:
+        downstream = {node_id: [] for node_id in node_ids}
+        for node_id in node_ids:
+            for source_id in upstream[node_id]:
+                downstream[source_id].append(node_id)
+
+    component_of = {}
+    count = 0
+    for node_id in node_ids:
+        if node_id in component_of:
+            continue
+        stack = [node_id]
+        while stack:
+            current = stack.pop()
+            if current in component_of:
+                continue
+            component_of[current] = count
+            stack.extend(upstream[current])
+            stack.extend(downstream[current])
+        count += 1
+
+    components = [[] for _ in range(count)]
+    for node_id in node_ids:
+        components[component_of[node_id]].append(node_id)
+    return Schedule(list(node_ids), upstream, downstream, components)
+
+
+@dataclass
+class ExecutionPlan:
+    """
+    Compiled schedule of the node graph.
+
+    Attributes:
+        generation (int): Graph generation the plan was compiled for
+        levels (List[List[str]]): Node ids grouped by topological level;
+            each level depends only on earlier ones
+        order (List[str]): All node ids in topological order
+        successors (Dict[str, List[str]]): Node id -> downstream node ids
+        predecessors (Dict[str, List[str]]): Node id -> upstream node ids
+    """
+
+    generation: int
+    levels: List[List[str]]
+    order: List[str]
+    successors: Dict[str, List[str]]
+    predecessors: Dict[str, List[str]]
+    _schedules: Dict[frozenset, Schedule] = field(
+        default_factory=dict, repr=False, compare=False
+    )
+
+    def subset_order(self, node_ids: Set[str]) -> List[str]:
+        """Node ids of a subset, in topological order."""
+        return [node_id for node_id in self.order if node_id in node_ids]
+
+    def schedule(self, node_ids: Iterable[str]) -> Schedule:
+        """
+        Return the schedule of a subset of the plan's nodes.
+
+        Schedules are memoized on the plan, so repeated runs of the same
+        nodes on an unchanged graph reuse their adjacency and components.
+
+        Args:
+            node_ids: Node ids to schedule (in any order)
+        """
+        key = frozenset(node_ids)
+        schedule = self._schedules.get(key)
+        if schedule is None:
+            if len(self._schedules) >= MAX_SCHEDULES:
+                self._schedules.clear()
+            schedule = self._schedules[key] = build_schedule(
+                self.subset_order(key), self.predecessors, self.successors
+            )
+        return schedule
+
+
+class GraphIndex:
+    """
+    Incremental index of the node graph.
+
+    Keeps adjacency sets in both directions plus the mapping between node
+    attributes (the editor's link endpoints) and their nodes, so linking,
+    unlinking and neighbour lookups are O(1) and deleting a node is
+    proportional to its own links rather than the whole graph.
+
+    The graph is kept acyclic: a topological order is maintained online
+    (Pearce-Kelly) and a link that would close a cycle is rejected with
+    CycleError. Only the nodes between the two endpoints in the current
+    order are visited when a link forces a reorder.
+
+    Attributes:
+        incoming (Dict[str, Set[str]]): Node id -> upstream node ids
+        outgoing (Dict[str, Set[str]]): Node id -> downstream node ids
+        attribute_node (Dict[str, str]): Attribute alias -> owning node id
+        node_attributes (Dict[str, Set[str]]): Node id -> attribute aliases
+        generation (int): Incremented on every node or link edit
+    """
+
+    def __init__(self) -> None:
+        self.generation = 0
+        self._plan: Optional[ExecutionPlan] = None
+        self.incoming: Dict[str, Set[str]] = {}
+        self.outgoing: Dict[str, Set[str]] = {}
+        self.attribute_node: Dict[str, str] = {}
+        self.node_attributes: Dict[str, Set[str]] = {}
+        # Position of each node in the maintained topological order
+        self._index: Dict[str, int] = {}
+        self._next_index = 0
+        # Links keyed by (source attribute, target attribute)
+        self._links: Set[Tuple[str, str]] = set()
+        self._attribute_links: Dict[str, Set[Tuple[str, str]]] = {}
+        # Number of attribute links between each (source, target) node pair
+        self._pair_links: Dict[Tuple[str, str], int] = {}
+
+    def clear(self) -> None:
+        """Remove every node and link (the generation keeps increasing)."""
+        generation = self.generation
+        self.__init__()
+        self.generation = generation + 1
+
+    def __contains__(self, node_id: str) -> bool:
+        return node_id in self.incoming
+
+    def __len__(self) -> int:
+        return len(self.incoming)
+
+    @property
+    def edges(self) -> List[Tuple[str, str]]:
+        """All links as (source attribute, target attribute) pairs."""
+        return list(self._links)
+
+    def add_node(self, node_id: str, attributes: Iterable[str] = ()) -> None:
+        """
+        Register a node and the attributes it can be linked through.
+
+        Args:
+            node_id: Node to add
+            attributes: Aliases of the node's input/output attributes
+        """
+        self.generation += 1
+        self.incoming.setdefault(node_id, set())
+        self.outgoing.setdefault(node_id, set())
+        if node_id not in self._index:
+            # A node without links can go anywhere: append it
+            self._index[node_id] = self._next_index
+            self._next_index += 1
+        owned = self.node_attributes.setdefault(node_id, set())
+        for attribute in attributes:
+            self.attribute_node[attribute] = node_id
+            owned.add(attribute)
+
+    def remove_node(self, node_id: str) -> None:
+        """Remove a node, its attributes and every link touching it."""
+        self.generation += 1
+        for attribute in self.node_attributes.pop(node_id, set()):
+            for source_attr, target_attr in list(
+                self._attribute_links.get(attribute, ())
+            ):
+                self.unlink(source_attr, target_attr)
+            self._attribute_links.pop(attribute, None)
+            self.attribute_node.pop(attribute, None)
+
+        self.incoming.pop(node_id, None)
+        self.outgoing.pop(node_id, None)
+        self._index.pop(node_id, None)
+
+    def node_of(self, attribute: str) -> str:
+        """Return the id of the node owning an attribute."""
+        return self.attribute_node[attribute]
+
+    def link(self, source_attr: str, target_attr: str) -> Tuple[str, str]:
+        """
+        Record a link between two attributes.
+
+        Returns:
+            Tuple of (source node id, target node id)
+
+        Raises:
+            CycleError: If the target node already reaches the source node;
+                the graph is left unchanged
+        """
+        source = self.attribute_node[source_attr]
+        target = self.attribute_node[target_attr]
+        key = (source_attr, target_attr)
+        if key in self._links:
+            return source, target
+
+        self._reorder(source, target)
+        self.generation += 1
+        self._links.add(key)
+        self._attribute_links.setdefault(source_attr, set()).add(key)
+        self._attribute_links.setdefault(target_attr, set()).add(key)
+        pair = (source, target)
+        self._pair_links[pair] = self._pair_links.get(pair, 0) + 1
+        self.outgoing[source].add(target)
+        self.incoming[target].add(source)
+        return source, target
+
+    def unlink(self, source_attr: str, target_attr: str) -> Optional[Tuple[str, str]]:
+        """
+        Remove a link between two attributes (given in either order).
+
+        Returns:
+            Tuple of (source node id, target node id), or None if the
+            attributes were not linked
+        """
+        key = (source_attr, target_attr)
+        if key not in self._links:
+            key = (target_attr, source_attr)
+            if key not in self._links:
+                return None
+
+        self.generation += 1
+        source = self.attribute_node[key[0]]
+        target = self.attribute_node[key[1]]
+        self._links.discard(key)
+        self._attribute_links[key[0]].discard(key)
+        self._attribute_links[key[1]].discard(key)
+
+        # Nodes stay adjacent while another attribute link joins them
+        remaining = self._pair_links[(source, target)] - 1
+        if remaining:
+            self._pair_links[(source, target)] = remaining
+        else:
+            del self._pair_links[(source, target)]
+            self.outgoing[source].discard(target)
+            self.incoming[target].discard(source)
+        return source, target
+
+    def predecessors(self, node_id: str) -> Set[str]:
+        """Upstream node ids of a node."""
+        return self.incoming.get(node_id, set())
+
+    def successors(self, node_id: str) -> Set[str]:
+        """Downstream node ids of a node."""
+        return self.outgoing.get(node_id, set())
+
+    def _reorder(self, source: str, target: str) -> None:
+        """
+        Restore the topological order before adding source -> target.
+
+        Nothing moves if source already precedes target. Otherwise the
+        nodes reachable from target and the nodes reaching source, both
+        limited to the affected index range, swap places in the order.
+        """
+        lower = self._index[target]
+        upper = self._index[source]
+        if source == target:
+            raise CycleError(f"Node {source} cannot be linked to itself")
+        if upper < lower:
+            return
+
+        # Forward search from target; reaching source means a cycle
+        forward = []
+        seen = {target}
+        stack = [target]
+        while stack:
+            current = stack.pop()
+            forward.append(current)
+            for child_id in self.outgoing[current]:
+                if child_id == source:
+                    raise CycleError(
+                        f"Linking {source} -> {target} would create a cycle"
+                    )
+                if child_id not in seen and self._index[child_id] < upper:
+                    seen.add(child_id)
+                    stack.append(child_id)
+
+        # Backward search from source
+        backward = []
+        seen = {source}
+        stack = [source]
+        while stack:
+            current = stack.pop()
+            backward.append(current)
+            for parent_id in self.incoming[current]:
+                if parent_id not in seen and self._index[parent_id] > lower:
+                    seen.add(parent_id)
+                    stack.append(parent_id)
+
+        # Reuse the same index slots: ancestors of source first, then
+        # descendants of target, each group keeping its relative order
+        backward.sort(key=self._index.get)
+        forward.sort(key=self._index.get)
+        slots = sorted(self._index[node_id] for node_id in backward + forward)
+        for node_id, slot in zip(backward + forward, slots):
+            self._index[node_id] = slot
+
+    def execution_plan(self) -> ExecutionPlan:
+        """
+        Return the compiled plan for the current graph.
+
+        The plan is memoized against the generation counter, so repeated
+        runs of an unchanged graph reuse it without re-planning.
+        """
+        if self._plan is None or self._plan.generation != self.generation:
+            self._plan = self._compile()
+        return self._plan
+
+    def _compile(self) -> ExecutionPlan:
+        """Group nodes into topological levels along the maintained order."""
+        successors = {node_id: list(dsts) for node_id, dsts in self.outgoing.items()}
+        predecessors = {node_id: list(srcs) for node_id, srcs in self.incoming.items()}
+        order = sorted(self._index, key=self._index.get)
+
+        # A node's level is one past its deepest upstream node's level
+        depth = {}
+        levels = []
+        for node_id in order:
+            level = max((depth[src] + 1 for src in predecessors[node_id]), default=0)
+            depth[node_id] = level
+            if level == len(levels):
+                levels.append([])
+            levels[level].append(node_id)
+
+        return ExecutionPlan(
+            generation=self.generation,
+            levels=levels,
+            order=order,
+            successors=successors,
+            predecessors=predecessors,
+        )
@@ -0,0 +1,207 @@
+"""
+Private HTTP cache for GET responses.
+
+Responses are kept in a size-bounded ResponseStore together with their
+validators. A fresh entry (Cache-Control max-age, or Expires) is served
+without a request; a stale one is revalidated with If-None-Match /
+If-Modified-Since, and a 304 answer refreshes and serves the stored body.
+Responses marked no-store (or Vary: *) are never stored, and no-cache
+entries are always revalidated.
+"""
+
+import json
+import time
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+
+from .cache import ResponseStore, content_key
+
+# Statuses whose responses are stored
+CACHEABLE_STATUSES = (200, 203, 300, 301, 308, 410)
+
+# Headers a 304 response must not overwrite on the stored entry
+UNCHANGED_HEADERS = ("content-length", "content-encoding", "transfer-encoding")
+
+
+def get_header(headers: Dict[str, str], name: str) -> Optional[str]:
+    """Case-insensitive header lookup."""
+    name = name.lower()
+    for key, value in headers.items():
+        if key.lower() == name:
+            return value
+    return None
+
+
+def cache_directives(headers: Dict[str, str]) -> Dict[str, Optional[str]]:
+    """Parse Cache-Control into {directive: argument or None}."""
+    directives = {}
+    for part in (get_header(headers, "Cache-Control") or "").split(","):
+        name, _, value = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = value.strip('"') or None
+    return directives
+
+
+def http_date(value: Optional[str]) -> Optional[float]:
+    """Parse an HTTP date into a timestamp (None if missing or invalid)."""
+    if not value:
+        return None
+    try:
+        return parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError):
+        return None
+
+
+@dataclass
+class CachedResponse:
+    """
+    Stored response with its validators.
+
+    Attributes:
+        status (int): HTTP status code
+        headers (Dict[str, str]): Response headers
+        body (bytes): Response body
+        stored_at (float): When the response was stored or last revalidated
+    """
+
+    status: int
+    headers: Dict[str, str]
+    body: bytes
+    stored_at: float = field(default_factory=time.time)
+
+    @property
+    def etag(self) -> Optional[str]:
+        return get_header(self.headers, "ETag")
+
+    @property
+    def last_modified(self) -> Optional[str]:
+        return get_header(self.headers, "Last-Modified")
+
+    def freshness_lifetime(self) -> float:
+        """Seconds the response stays fresh after it was generated."""
+        directives = cache_directives(self.headers)
+        if "no-cache" in directives:
+            return 0.0
+        if directives.get("max-age"):
+            try:
+                return float(directives["max-age"])
+            except ValueError:
+                return 0.0
+
+        expires = http_date(get_header(self.headers, "Expires"))
+        if expires is None:
+            return 0.0
+        date = http_date(get_header(self.headers, "Date")) or self.stored_at
+        return max(expires - date, 0.0)
+
+    def age(self, now: Optional[float] = None) -> float:
+        """Current age: the Age header at storage plus time since."""
+        try:
+            initial = float(get_header(self.headers, "Age") or 0)
+        except ValueError:
+            initial = 0.0
+        return initial + max((now or time.time()) - self.stored_at, 0.0)
+
+    def is_fresh(self, now: Optional[float] = None) -> bool:
+        """Whether the entry may be served without contacting the server."""
+        return self.age(now) < self.freshness_lifetime()
+
+    def validators(self) -> Dict[str, str]:
+        """Conditional request headers for revalidating this entry."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def encode(self) -> bytes:
+        """Serialize as a JSON metadata line followed by the raw body."""
+        meta = {
+            "status": self.status,
+            "headers": self.headers,
+            "stored_at": self.stored_at,
+        }
+        return json.dumps(meta).encode("utf-8") + b"\n" + self.body
+
+    @classmethod
+    def decode(cls, value: bytes) -> "CachedResponse":
+        meta, _, body = value.partition(b"\n")
+        meta = json.loads(meta)
+        return cls(meta["status"], meta["headers"], body, meta["stored_at"])
+
+
+class HTTPCache:
+    """
+    Validator-aware cache of GET responses in a ResponseStore.
+
+    Attributes:
+        store (ResponseStore): Size-bounded durable store of entries
+        max_entry_bytes (int): Larger bodies are not stored
+    """
+
+    def __init__(self, store: ResponseStore, max_entry_bytes: int = 8 * 1024 * 1024):
+        self.store = store
+        self.max_entry_bytes = max_entry_bytes
+
+    @staticmethod
+    def key(url: str) -> str:
+        return content_key("GET", url)
+
+    def get(self, url: str) -> Optional[CachedResponse]:
+        """Return the stored entry for url (fresh or stale), or None."""
+        value = self.store.get(self.key(url))
+        if value is None:
+            return None
+        try:
+            return CachedResponse.decode(value)
+        except (ValueError, KeyError):
+            return None
+
+    def put(
+        self, url: str, status: int, headers: Dict[str, str], body: bytes
+    ) -> Optional[CachedResponse]:
+        """
+        Store a response if HTTP caching rules allow it.
+
+        Returns:
+            The stored entry, or None if the response is not storable
+        """
+        directives = cache_directives(headers)
+        if (
+            status not in CACHEABLE_STATUSES
+            or "no-store" in directives
+            or (get_header(headers, "Vary") or "").strip() == "*"
+            or len(body) > self.max_entry_bytes
+        ):
+            return None
+
+        entry = CachedResponse(status, headers, body)
+        if not (entry.etag or entry.last_modified or entry.freshness_lifetime()):
+            # Neither fresh nor revalidatable: storing it would never help
+            return None
+        self.store.put(self.key(url), entry.encode())
+        return entry
+
+    def refresh(
+        self, url: str, entry: CachedResponse, headers: Dict[str, str]
+    ) -> CachedResponse:
+        """
+        Apply a 304 Not Modified answer to a stored entry.
+
+        The 304's headers (new validators, Cache-Control, Date...) replace
+        the stored ones, except those describing the stored body.
+        """
+        # The stored Age described the original response, not this one
+        updated = {k: v for k, v in entry.headers.items() if k.lower() != "age"}
+        for name, value in headers.items():
+            if name.lower() in UNCHANGED_HEADERS:
+                continue
+            for existing in [key for key in updated if key.lower() == name.lower()]:
+                del updated[existing]
+            updated[name] = value
+
+        refreshed = CachedResponse(entry.status, updated, entry.body)
+        self.store.put(self.key(url), refreshed.encode())
+        return refreshed
@@ -0,0 +1,364 @@
+import http.client
+import os
+import threading
+import time
+import zlib
+from collections import deque
+from typing import Deque, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+# Connections kept open per (scheme, host, port) (override with
+# LIGHTHOUSE_HTTP_MAX_PER_HOST)
+DEFAULT_MAX_PER_HOST = int(os.environ.get("LIGHTHOUSE_HTTP_MAX_PER_HOST", "10"))
+
+# Errors raised when a server closed an idle keep-alive connection
+STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.BadStatusLine,
+    BrokenPipeError,
+    ConnectionResetError,
+    ConnectionAbortedError,
+)
+
+HostKey = Tuple[str, str, int]
+
+# Response encodings DecodingReader can undo (sent as Accept-Encoding)
+ACCEPT_ENCODING = "gzip, deflate"
+
+# Compressed bytes read from the wire per decompression step
+DECODE_CHUNK_SIZE = 64 * 1024
+
+
+class HTTPStatusError(Exception):
+    """Raised when a server answers with an error status (4xx/5xx)."""
+
+    def __init__(self, status: int, reason: str, method: str, url: str) -> None:
+        super().__init__(f"HTTP {status} {reason}: {method} {url}")
+        self.status = status
+        self.reason = reason
+
+
+class PooledResponse:
+    """
+    Response whose connection returns to the pool once it is closed.
+
+    The connection is only reused if the body was read completely and the
+    server did not ask to close it; otherwise it is discarded.
+
+    Attributes:
+        status (int): HTTP status code
+        reason (str): HTTP reason phrase
+        headers (http.client.HTTPMessage): Response headers
+    """
+
+    def __init__(
+        self,
+        pool: "ConnectionPool",
+        key: HostKey,
+        connection: http.client.HTTPConnection,
+        response: http.client.HTTPResponse,
+    ) -> None:
+        self.status = response.status
+        self.reason = response.reason
+        self.headers = response.headers
+        self._pool = pool
+        self._key = key
+        self._connection = connection
+        self._response = response
+        self._released = False
+
+    def read(self, amt: Optional[int] = None) -> bytes:
+        """Read up to amt bytes of the body (all of it if amt is None)."""
+        return self._response.read(amt)
+
+    def readinto(self, buffer: bytearray) -> int:
+        """Read the next chunk of the body into buffer; returns its size."""
+        return self._response.readinto(buffer)
+
+    def close(self) -> None:
+        """Finish with the response and hand its connection back."""
+        if self._released:
+            return
+        self._released = True
+        reusable = self._response.isclosed() and not self._response.will_close
+        if not reusable:
+            self._response.close()
+        self._pool.release(self._key, self._connection, reusable)
+
+    def __enter__(self) -> "PooledResponse":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class DecodingReader:
+    """
+    Stream a response body, undoing its Content-Encoding chunk by chunk.
+
+    Compressed data is read in DECODE_CHUNK_SIZE pieces and inflated at
+    most one output buffer at a time, so neither the compressed nor the
+    decoded body is ever held in memory as a whole.
+
+    Attributes:
+        wire_bytes (int): Body bytes read from the connection
+        decoded_bytes (int): Body bytes returned after decoding
+    """
+
+    def __init__(self, response: PooledResponse, encoding: str = "") -> None:
+        """
+        Args:
+            response: Response to read from
+            encoding: Content-Encoding header ("gzip", "deflate" or "")
+
+        Raises:
+            ValueError: If the encoding is not supported
+        """
+        self.response = response
+        self.wire_bytes = 0
+        self.decoded_bytes = 0
+        self._pending = b""
+        self._eof = False
+
+        encoding = encoding.strip().lower()
+        if encoding in ("", "identity"):
+            self._decoder = None
+        elif encoding in ("gzip", "x-gzip"):
+            self._decoder = zlib.decompressobj(wbits=zlib.MAX_WBITS | 16)
+        elif encoding == "deflate":
+            self._decoder = zlib.decompressobj()
+        else:
+            raise ValueError(f"Unsupported Content-Encoding: {encoding}")
+        self._raw_deflate = encoding != "deflate"
+
+    @property
+    def decoding(self) -> bool:
+        """Whether the body is being decoded (not sent as identity)."""
+        return self._decoder is not None
+
+    def decoded_headers(self, headers: Dict[str, str]) -> Dict[str, str]:
+        """
+        Rewrite response headers to describe the decoded body.
+
+        Once the whole body has been read, Content-Encoding is dropped and
+        Content-Length set to the decoded size; headers of an identity
+        response are returned unchanged.
+        """
+        if not self.decoding:
+            return dict(headers)
+        decoded = {
+            name: value
+            for name, value in headers.items()
+            if name.lower() not in ("content-encoding", "content-length")
+        }
+        decoded["Content-Length"] = str(self.decoded_bytes)
+        return decoded
+
+    def readinto(self, buffer: bytearray) -> int:
+        """Read the next chunk of the decoded body into buffer; returns its size."""
+        if self._decoder is None:
+            count = self.response.readinto(buffer)
+            self.wire_bytes += count
+            self.decoded_bytes += count
+            return count
+
+        size = len(buffer)
+        while not self._pending:
+            if self._decoder.unconsumed_tail:
+                data = self._decoder.unconsumed_tail
+            elif self._eof:
+                return 0
+            else:
+                data = self.response.read(DECODE_CHUNK_SIZE)
+                self.wire_bytes += len(data)
+                if not data:
+                    self._eof = True
+                    self._pending = self._decoder.flush()
+                    continue
+            self._pending = self._decompress(data, size)
+
+        count = min(size, len(self._pending))
+        buffer[:count] = self._pending[:count]
+        self._pending = self._pending[count:]
+        self.decoded_bytes += count
+        return count
+
+    def _decompress(self, data: bytes, size: int) -> bytes:
+        try:
+            return self._decoder.decompress(data, size)
+        except zlib.error:
+            # Some servers send raw deflate without the zlib header
+            if self._raw_deflate or self.decoded_bytes:
+                raise
+            self._raw_deflate = True
+            self._decoder = zlib.decompressobj(-zlib.MAX_WBITS)
+            return self._decoder.decompress(data, size)
+
+
+class ConnectionPool:
+    """
+    Thread-safe pool of keep-alive HTTP(S) connections.
+
+    Connections are keyed by (scheme, host, port), so repeated requests to
+    the same server reuse open TCP (and TLS) connections instead of paying
+    for a new handshake each time. At most max_per_host connections per
+    server are in use at once; further requests wait for one to be
+    released. Idle connections are closed after idle_timeout seconds.
+
+    Attributes:
+        max_per_host (int): Concurrent connections allowed per server
+        idle_timeout (float): Seconds an idle connection is kept open
+        created (int): Connections opened
+        reused (int): Requests sent on an already open connection
+    """
+
+    def __init__(
+        self, max_per_host: int = DEFAULT_MAX_PER_HOST, idle_timeout: float = 30.0
+    ) -> None:
+        self.max_per_host = max_per_host
+        self.idle_timeout = idle_timeout
+        self.created = 0
+        self.reused = 0
+        self._idle: Dict[HostKey, Deque[Tuple[http.client.HTTPConnection, float]]] = {}
+        self._slots: Dict[HostKey, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        body: Optional[bytes] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: float = 30.0,
+    ) -> PooledResponse:
+        """
+        Send a request on a pooled connection.
+
+        A request that fails on a reused connection because the server
+        closed it while idle is retried once on a new connection.
+
+        Args:
+            method: HTTP method
+            url: Absolute http:// or https:// URL
+            body: Request body
+            headers: Request headers
+            timeout: Socket timeout in seconds
+
+        Returns:
+            Response; close it (or use it as a context manager) to
+            release the connection
+
+        Raises:
+            ValueError: If the URL is not an absolute HTTP(S) URL
+        """
+        parts = urlsplit(url)
+        if parts.scheme not in ("http", "https") or not parts.hostname:
+            raise ValueError(f"Unsupported URL: {url}")
+        default_port = 443 if parts.scheme == "https" else 80
+        key = (parts.scheme, parts.hostname, parts.port or default_port)
+        target = parts.path or "/"
+        if parts.query:
+            target = f"{target}?{parts.query}"
+
+        self._slot(key).acquire()
+        try:
+            while True:
+                connection, reused = self._checkout(key, timeout)
+                try:
+                    connection.request(method, target, body=body, headers=headers or {})
+                    response = connection.getresponse()
+                except STALE_CONNECTION_ERRORS:
+                    connection.close()
+                    if not reused:
+                        raise
+                    continue
+                except BaseException:
+                    connection.close()
+                    raise
+                return PooledResponse(self, key, connection, response)
+        except BaseException:
+            self._slot(key).release()
+            raise
+
+    def release(
+        self, key: HostKey, connection: http.client.HTTPConnection, reusable: bool
+    ) -> None:
+        """Return a connection to the pool (closing it if not reusable)."""
+        if reusable:
+            released_at = time.monotonic()
+            with self._lock:
+                self._idle.setdefault(key, deque()).append((connection, released_at))
+        else:
+            connection.close()
+        self._slot(key).release()
+
+    def stats(self) -> Dict[str, int]:
+        """Snapshot of the pool counters and idle connections."""
+        with self._lock:
+            idle = sum(len(connections) for connections in self._idle.values())
+        return {"created": self.created, "reused": self.reused, "idle": idle}
+
+    def close(self) -> None:
+        """Close every idle connection."""
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for connections in idle.values():
+            for connection, _ in connections:
+                connection.close()
+
+    def _slot(self, key: HostKey) -> threading.BoundedSemaphore:
+        with self._lock:
+            slot = self._slots.get(key)
+            if slot is None:
+                slot = self._slots[key] = threading.BoundedSemaphore(self.max_per_host)
+            return slot
+
+    def _checkout(
+        self, key: HostKey, timeout: float
+    ) -> Tuple[http.client.HTTPConnection, bool]:
+        """Take the most recently used idle connection, or open a new one."""
+        expired = []
+        connection = None
+        with self._lock:
+            idle = self._idle.get(key)
+            now = time.monotonic()
+            while idle:
+                candidate, released_at = idle.pop()
+                if now - released_at <= self.idle_timeout:
+                    connection = candidate
+                    break
+                expired.append(candidate)
+            # Older entries of the deque expired as well
+            while idle and now - idle[0][1] > self.idle_timeout:
+                expired.append(idle.popleft()[0])
+            if connection is not None:
+                self.reused += 1
+            else:
+                self.created += 1
+
+        for candidate in expired:
+            candidate.close()
+
+        if connection is not None:
+            connection.timeout = timeout
+            if connection.sock is not None:
+                connection.sock.settimeout(timeout)
+            return connection, True
+
+        scheme, host, port = key
+        if scheme == "https":
+            return http.client.HTTPSConnection(host, port, timeout=timeout), False
+        return http.client.HTTPConnection(host, port, timeout=timeout), False
+
+
+_pool: Optional[ConnectionPool] = None
+_pool_lock = threading.Lock()
+
+
+def http_pool() -> ConnectionPool:
+    """Return the process-wide HTTP connection pool."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ConnectionPool()
+        return _pool
@@ -1,4 +1,18 @@
-from .executor import *
+import queue
+
+import dearpygui.dearpygui as dpg
+
+from .node_view import NodeView
+from .workflow import *
+
+
+# Status text colors shown on nodes
+STATUS_COLORS = {
+    "PENDING": (101, 122, 231),
+    "RUNNING": (194, 188, 81),
+    "COMPLETED": (83, 202, 74),
+    "ERROR": (214, 84, 84),
+}
 
 class LighthouseApp:
     """
@@ -12,9 +26,11 @@ class LighthouseApp:
         title (str): Application window title
         width (int): Viewport width in pixels
         height (int): Viewport height in pixels
+        workflow (Workflow): Headless engine holding nodes, links and executor
         nodes (Dict[str, NodeBase]): Dictionary of all active nodes
-        edge (List[Tuple[str, str]]): List of connections between nodes
-        connections (Dict[str, List[NodeBase]]): Node connection graph
+        graph (GraphIndex): Links between nodes, indexed in both directions
+        views (Dict[str, NodeView]): Editor views of the nodes by id
+        executor (Executor): Runs workflows on a bounded worker pool
     """
 
     def __init__(
@@ -22,6 +38,8 @@ class LighthouseApp:
         title: str = "Lighthouse",
         width: int = 1400,
         height: int = 900,
+        max_workers: Optional[int] = None,
+        streaming: bool = False,
     ) -> None:
         """
         Initialize the application.
@@ -30,15 +48,26 @@ class LighthouseApp:
             title: Window title for the application
             width: Viewport width in pixels
             height: Viewport height in pixels
+            max_workers: Maximum nodes executed concurrently
+            streaming: Stream items between nodes as they are produced
         """
         self.title = title
         self.width = width
         self.height = height
-        self.nodes: Dict[str, NodeBase] = {}
-        self.edges: List[tuple] = []  # Stores (from_node, to_node) pairs
-        self.connections: Dict = {}
-
-        self.executor = Executor()
+        # Headless engine; the editor only renders it and forwards edits
+        self.workflow = Workflow(
+            Executor(max_workers=max_workers, streaming=streaming)
+        )
+        self.nodes = self.workflow.nodes
+        self.graph = self.workflow.graph
+        self.executor = self.workflow.executor
+        self.views: Dict[str, NodeView] = {}
+
+        # Status events arrive on executor threads; applied once per frame
+        self._status_events = queue.SimpleQueue()
+        self.executor.subscribe(
+            lambda node_id, status: self._status_events.put((node_id, status))
+        )
 
         # Initialize DearPyGui context and viewport
         dpg.create_context()
@@ -61,24 +90,19 @@ class LighthouseApp:
         # console.print((sender, source_attr, target_attr))
         # inspect((sender, source_attr, target_attr))
 
-        self.edges.append((source_attr, target_attr))
+        # Reject links that would close a cycle before drawing them
+        try:
+            self.workflow.link_attributes(source_attr, target_attr)
+        except CycleError as e:
+            console.print(f"[yellow]Link rejected: {e}[/yellow]")
+            return
+
         dpg.add_node_link(
             source_attr, target_attr, parent=sender, tag=f"{source_attr}_{target_attr}"
         )
 
-        target_node_id = target_attr.split("_")[0]
-        src_node_id = source_attr.split("_")[0]
-
-        if target_node_id in self.connections.keys():
-            self.connections[target_node_id].append(src_node_id)
-        else:
-            self.connections[target_node_id] = []
-            self.connections[target_node_id].append(src_node_id)
-
         # console.print(f"Link Testing {[source_attr, target_attr]}")
-        # console.print(self.connections)
-        # console.print(self.edges)
-        # inspect([self.connections, self.edges])
+        # console.print(self.graph.edges)
 
     def delink_callback(self, sender, app_data, user_data):
         """Handle node delinking"""
@@ -89,26 +113,12 @@ class LighthouseApp:
         edge = dpg.get_item_configuration(item=app_data)
 
         source_full = dpg.get_item_alias(edge["attr_1"])
-        source = source_full.split("_")[0]
         target_full = dpg.get_item_alias(edge["attr_2"])
-        target = target_full.split("_")[0]
-
-        self.connections[target] = [i for i in self.connections[target] if i != source]
 
-        edges = []
-        for src, target in self.edges:
-            if src == source_full and target == target_full:
-                pass
-            elif src == target_full and target == source_full:
-                pass
-            else:
-                edges.append((src, target))
-        self.edges = edges
+        self.workflow.unlink_attributes(source_full, target_full)
 
         # console.print(f"Delink Testing {[source_full, target_full]}")
-        # console.print(self.connections)
-        # console.print(self.edges)
-        # inspect([self.connections, self.edges])
+        # console.print(self.graph.edges)
 
         dpg.delete_item(app_data)
 
@@ -222,13 +232,21 @@ class LighthouseApp:
 
         with dpg.viewport_menu_bar():
             with dpg.menu(label="File"):
-                dpg.add_menu_item(label="Save", callback=print_me)
+                dpg.add_menu_item(
+                    label="Open...", callback=lambda: dpg.show_item("open_dialog")
+                )
+                dpg.add_menu_item(
+                    label="Save...", callback=lambda: dpg.show_item("save_dialog")
+                )
                 dpg.add_menu_item(label="Exit", callback=dpg.destroy_context)
 
                 with dpg.menu(label="Settings"):
                     dpg.add_menu_item(label="Setting 1", callback=print_me, check=True)
                     dpg.add_menu_item(label="Setting 2", callback=print_me)
 
+            with dpg.menu(label="Run"):
+                dpg.add_menu_item(label="Run All", callback=self._exec_all)
+
             with dpg.menu(label="Widget Items"):
                 dpg.add_checkbox(label="Pick Me", callback=print_me)
                 dpg.add_button(label="Press Me", callback=print_me)
@@ -243,6 +261,23 @@ class LighthouseApp:
                 dpg.add_text("  RayB - Dec '25")
                 dpg.add_text("  Version: 0.1")
 
+        # ----------------------------------------------------------------
+        # Workflow file dialogs (JSON, or the compact binary encoding)
+        # ----------------------------------------------------------------
+        for tag, callback in (
+            ("open_dialog", self._open_dialog_callback),
+            ("save_dialog", self._save_dialog_callback),
+        ):
+            with dpg.file_dialog(
+                tag=tag,
+                show=False,
+                callback=callback,
+                width=700,
+                height=400,
+            ):
+                dpg.add_file_extension(".json", color=(120, 180, 255))
+                dpg.add_file_extension(BINARY_SUFFIX, color=(83, 202, 74))
+
         # ----------------------------------------------------------------
         # Primary window containing the node editor
         # ----------------------------------------------------------------
@@ -379,15 +414,11 @@ class LighthouseApp:
             console.print(type_name)
 
             # Instantiate the node class from the enum value
-            node = type_name.value(
-                f"{type_name.name.replace('_', ' ')}",
-                parent="node_editor",
-                exec_cb=self._exec_node,
-                delete_cb=self._del_node,
-            )
+            node = type_name.value(f"{type_name.name.replace('_', ' ')}")
 
-            # Register node in the nodes dictionary
-            self.nodes[node.id] = node
+            # Register the node with the engine and render it
+            self.workflow.add_node(node)
+            self._add_view(node)
 
             console.print(f"[green]Added {type_name.name} node: {node.id[-8:]}[/green]")
 
@@ -409,15 +440,11 @@ class LighthouseApp:
         """
         try:
             # Instantiate the node class from the enum value
-            node = type_name.value(
-                f"{type_name.name.replace('_', ' ')}",
-                parent="node_editor",
-                exec_cb=self._exec_node,
-                delete_cb=self._del_node,
-            )
+            node = type_name.value(f"{type_name.name.replace('_', ' ')}")
 
-            # Register node in the nodes dictionary
-            self.nodes[node.id] = node
+            # Register the node with the engine and render it
+            self.workflow.add_node(node)
+            self._add_view(node)
 
             console.print(f"[green]Added {type_name.name} node: {node.id[-8:]}[/green]")
 
@@ -427,160 +454,113 @@ class LighthouseApp:
         # Hide the context menu after adding node
         dpg.configure_item("context_menu", show=False)
 
-    def _set_exec_status(self, node_id, color, status):
+    def _add_view(self, node: NodeBase, at_mouse: bool = True) -> None:
+        """Render a node registered with the workflow in the editor."""
+        self.views[node.id] = NodeView(
+            node,
+            parent="node_editor",
+            exec_cb=self._exec_node,
+            delete_cb=self._del_node,
+            at_mouse=at_mouse,
+        )
 
-        self.nodes[node_id].status = status
+    def _sync_positions(self) -> None:
+        """Copy editor node positions to the models (nodes may be dragged)."""
+        for node_id in self.views:
+            self.nodes[node_id].pos = list(dpg.get_item_pos(node_id))
 
-        dpg.set_value(item=f"{node_id}_exec_status", value=status)
-        dpg.configure_item(
-            item=f"{node_id}_exec_status",
-            color=color,
-        )
-        if status == "RUNNING":
-            dpg.configure_item(
-                item=f"{node_id}_loading",
-                show=True,
-                color=color,
+    def _open_dialog_callback(self, sender, app_data):
+        self._load_workflow(app_data["file_path_name"])
+
+    def _save_dialog_callback(self, sender, app_data):
+        self._save_workflow(app_data["file_path_name"])
+
+    def _save_workflow(self, path: str) -> None:
+        """
+        Save the canvas (nodes, their positions and links) to a file.
+
+        Args:
+            path: Destination file; BINARY_SUFFIX selects the compact encoding
+        """
+        self._sync_positions()
+        try:
+            self.workflow.save(path)
+        except OSError as e:
+            console.print(f"[red]Failed to save workflow: {e}[/red]")
+            return
+        console.print(f"[green]Saved workflow ({len(self.nodes)} nodes)[/green]")
+
+    def _load_workflow(self, path: str) -> None:
+        """
+        Replace the canvas with a workflow file written by _save_workflow.
+
+        The file is decoded and bulk-loaded by the engine first; the
+        editor items are only replaced once that has succeeded, so an
+        invalid file leaves the current workflow and canvas in place.
+
+        Args:
+            path: Workflow file (JSON or the compact binary encoding)
+        """
+        try:
+            with open(path, "rb") as f:
+                data = decode_workflow(f.read())
+        except (OSError, ValueError) as e:
+            console.print(f"[red]Failed to open workflow: {e}[/red]")
+            return
+
+        self._sync_positions()
+        try:
+            self.workflow.restore(data)
+        except (ValueError, CycleError) as e:
+            console.print(f"[red]Failed to open workflow: {e}[/red]")
+            return
+
+        for view in self.views.values():
+            view.remove()
+        self.views.clear()
+        for node in self.nodes.values():
+            self._add_view(node, at_mouse=False)
+        for source_attr, target_attr in self.graph.edges:
+            dpg.add_node_link(
+                source_attr,
+                target_attr,
+                parent="node_editor",
+                tag=f"{source_attr}_{target_attr}",
             )
-        else:
-            dpg.configure_item(item=f"{node_id}_loading", show=False)
-
-    def _topo_sort(self):
-
-        # console.print(self.connections)
-        # console.print(self.edges)
-
-        in_degree = {}
-        for n_id, _ in self.nodes.items():
-            if n_id in self.connections.keys():
-                in_degree[n_id] = len(self.connections[n_id])
-            else:
-                in_degree[n_id] = 0
-
-        # console.print(in_degree)
-
-        # Build adjacency list (outgoing connections)
-        # self.connections stores incoming, so we need to reverse it
-        outgoing = {n_id: [] for n_id, _ in self.nodes.items()}
-        # print(f"nodes: {self.nodes.items()}")
-        # print(f"nodes: {self.connections.items()}")
-        for target_node, source_nodes in self.connections.items():
-            for source_node in source_nodes:
-                outgoing[source_node].append(target_node)
-
-        # Start with nodes that have no incoming edges
-        queue = [node_id for node_id, degree in in_degree.items() if degree == 0]
-        # queue = deque([node_id for node_id, degree in in_degree.items() if degree == 0])
-        result = []
-        processed = 0
-
-        # while queue:
-        #     current_level = list(queue)
-        #     result.append(current_level)
-        #     queue.clear()
-
-        #     processed += len(current_level)
-
-        #     for node_id in current_level:
-        #         if node_id in outgoing:
-        #             for child_id in outgoing[node_id]:
-        #                 if child_id in in_degree:
-        #                     in_degree[child_id] -= 1
-
-        #                     if in_degree[child_id] == 0:
-        #                         queue.append(child_id)
-
-        # if processed < len(in_degree):
-        #     unprocessed = [
-        #         node_id for node_id, degree in in_degree.items() if degree > 0
-        #     ]
-        #     console.print(
-        #         f"[red]Warning: Cycle detected! Unprocessed nodes: {unprocessed}[/red]"
-        #     )
-        #     return [list(in_degree.keys())]  # Fallback to sequential
-
-        # console.print(
-        #     f"[cyan]Topological sort complete: {len(result)} levels, {processed} nodes[/cyan]"
-        # )
-        # for i, level in enumerate(result):
-        #     node_names = [self.nodes[nid].name for nid in level]
-        #     console.print(f"  Level {i}: {node_names}")
-
-        while queue:
-            current = queue.pop(0)
-            result.append(current)
-
-            # For each node that current points to
-            for neighbor in outgoing[current]:
-                in_degree[neighbor] -= 1
-                # If neighbor now has no incoming edges, add to queue
-                if in_degree[neighbor] == 0:
-                    queue.append(neighbor)
-
-        # Check for cycles
-        if len(result) != len(self.nodes):
-            console.print("Warning: Cycle detected in graph!")
-            return list(self.nodes.keys())  # Return original order if cycle exists
-
-        return result
-
-    def _execute_step(self, node_id):
-        self._set_exec_status(node_id, (194, 188, 81), "RUNNING")
-
-        time.sleep(3)
-
-        self.nodes[node_id].execute()
-
-        self._set_exec_status(node_id, (83, 202, 74), "COMPLETED")
+        console.print(f"[green]Opened workflow ({len(self.nodes)} nodes)[/green]")
+
+    def _set_exec_status(self, node_id, color, status):
+        view = self.views.get(node_id)
+        if view is not None:
+            view.set_status(status, color)
 
     def _exec_graph(self, node_id):
 
-        execution_order = self._topo_sort()
-        console.print(execution_order)
-        execution_nodes = [self.nodes[i] for i in execution_order]
-
-        self.executor.create_execution(execution_nodes, self.connections)
-
-        # Iterate to execute
-        started = False
-        for nid in execution_order:
-            if self.nodes[nid].status == "PENDING":
-                self._execute_step(nid)
-            elif self.nodes[nid].status == "ERROR":
-                self._execute_step(nid)
-            elif self.nodes[nid].status == "COMPLETED" and started == True:
-                self._execute_step(nid)
-            elif (
-                self.nodes[nid].status == "COMPLETED"
-                and started == False
-                and nid == node_id
-            ):
-                started = True
-                self._execute_step(nid)
-            else:
-                pass  # Should be unreachable
+        # Only the clicked node's downstream subgraph and the ancestors it
+        # needs run; clean nodes reuse their last outputs
+        self.workflow.run(node_id)
+
+    def _exec_all(self) -> None:
+        """Run every stale node; independent components run concurrently."""
+        self.workflow.run()
 
-        self.executor.end_execution()
+    def _drain_exec_events(self) -> None:
+        """Apply status events posted by the executor (called once per frame)."""
+        while True:
+            try:
+                node_id, status = self._status_events.get_nowait()
+            except queue.Empty:
+                return
+            self._set_exec_status(node_id, STATUS_COLORS[status], status)
 
     def _exec_node(self, node_id):
         console.print(f"ENGINE: Attempting to start execution from {node_id}")
         self._exec_graph(node_id)
 
     def _del_node(self, node_id):
-        self.nodes.pop(node_id, None)
-        self.connections.pop(node_id, None)
-        # Remove this node from other nodes' connection lists (outgoing edges from this node)
-        for target_node in self.connections:
-            self.connections[target_node] = [
-                src for src in self.connections[target_node] if src != node_id
-            ]
-
-        # Remove all edges involving this node
-        self.edges = [
-            (src, target)
-            for src, target in self.edges
-            if not (src.startswith(f"{node_id}_") or target.startswith(f"{node_id}_"))
-        ]
+        # The view already removed its items; drop the node from the engine
+        self.views.pop(node_id, None)
+        self.workflow.remove_node(node_id)
 
         # console.print(f"ENGINE: Deleting Node {node_id} from Engine")
         # console.print(self.nodes)
@@ -590,7 +570,9 @@ class LighthouseApp:
         Start the application main loop.
 
         Initializes DearPyGui, shows the viewport, and starts the
-        rendering loop. Blocks until the application is closed.
+        rendering loop. Workflows execute on the executor's background
+        threads, so the loop keeps rendering while they run. Blocks until
+        the application is closed.
         """
         # Setup DearPyGui internals
         dpg.setup_dearpygui()
@@ -601,8 +583,12 @@ class LighthouseApp:
         # Show the viewport window
         dpg.show_viewport()
 
-        # Start the main rendering loop (blocks until window closed)
-        dpg.start_dearpygui()
+        # Main rendering loop (blocks until window closed), applying
+        # execution status updates between frames
+        while dpg.is_dearpygui_running():
+            self._drain_exec_events()
+            dpg.render_dearpygui_frame()
 
-        # Cleanup DearPyGui context after exit
+        # Cleanup executor pools and DearPyGui context after exit
+        self.workflow.shutdown()
         dpg.destroy_context()
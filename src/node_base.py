@@ -1,16 +1,23 @@
-import dearpygui.dearpygui as dpg
+import asyncio
+import copy
+import inspect
 from enum import Enum
-from abc import ABC, abstractmethod
+from abc import ABC
 import uuid
-from typing import Dict, Any, List
+from typing import Dict, Any, AsyncIterator, Iterator, List, Optional, Tuple
 import time
 import os
+import pickle
 import sys
 
 
 from rich.console import Console
 
-console = Console()
+from .cache import content_key
+from .resolver import build_scope, resolve_fields
+
+# Engine logs go to stderr so stdout stays free for results (see src/run.py)
+console = Console(stderr=True)
 
 
 # ============================================================================
@@ -27,159 +34,79 @@ class LongString(str):
     pass
 
 
+class ExecutionMode(Enum):
+    """
+    Where a node's synchronous execute() runs.
+
+    INLINE runs directly on the executor's event loop (trivial nodes),
+    THREAD offloads to the worker thread pool (blocking I/O), and PROCESS
+    serializes the node to a process pool (CPU-bound work, avoids the GIL).
+    """
+
+    INLINE = "inline"
+    THREAD = "thread"
+    PROCESS = "process"
+
+
 class NodeBase(ABC):
     """
-    Abstract base class for all node types in the editor.
+    Abstract base class for all node types.
 
-    This class provides the core functionality for visual nodes including:
-    - UI rendering in the node editor
-    - Configuration inspector windows
-    - State management
-    - Execution lifecycle
+    Nodes are pure models: they hold their field definitions, state and
+    execution lifecycle and never touch the GUI, so workflows run headless.
+    The editor renders each node through a NodeView (see node_view.py).
 
     Attributes:
         id (str): Unique identifier for the node (UUID)
         name (str): Display name of the node shown in the editor
         pos (List[int]): [x, y] position coordinates in the editor
-        parent (str): Tag of the parent DearPyGui container
+        status (str): Last execution status (PENDING, RUNNING, ...)
         state (Dict[str, Any]): Current runtime state of the node
+        is_dirty (bool): Whether the last outputs are stale and the node
+            must run again (cleared by a successful execution)
+        edit_version (int): Incremented whenever the node is marked stale,
+            so a run can tell whether it was edited while executing
         fields (Dict[str, Dict[str, Any]]): Field definitions with types and defaults
+        execution_mode (ExecutionMode): How execute() is scheduled; set on a
+            subclass for a per-type default or on an instance to override
+        batch_size (int): Input items handed to execute_batch() per call
+            (0 hands over all items at once)
+        cacheable (bool): Whether results of this node type may be served
+            from the executor's result cache
+        cache_ttl (Optional[float]): Seconds a cached result stays valid
+            (None keeps it until evicted)
+        has_inputs (bool): Whether the node accepts input connections
+        has_config (bool): Whether the node has editable fields
+        summary_fields (Tuple[str, ...]): State fields shown on the node
     """
 
-    def __init__(self, name: str, parent: str, exec_cb, delete_cb) -> None:
+    execution_mode: ExecutionMode = ExecutionMode.THREAD
+    batch_size: int = 1
+    cacheable: bool = False
+    cache_ttl: Optional[float] = None
+    has_inputs: bool = True
+    has_config: bool = True
+    summary_fields: Tuple[str, ...] = ()
+
+    def __init__(self, name: str, node_id: Optional[str] = None) -> None:
         """
         Initialize a new node instance.
 
         Args:
             name: Display name for the node (shown in editor)
-            parent: Tag of the parent DearPyGui container (node editor)
+            node_id: Identifier to restore (a new one is generated if None)
         """
-        self.id = str(uuid.uuid4())[-8:]
-        print(self.id)
+        self.id = node_id or str(uuid.uuid4())[-8:]
         self.name = name
         self.pos = [0, 0]
-        self.parent = parent
-        self.exec_callback = exec_cb
-        self.delete_cb = delete_cb
         self.status = "PENDING"
+        self.is_dirty = True
+        self.edit_version = 0
+        self.change_cb = None
+        self.result_cache = None
         self.state: Dict[str, Any] = {}
         self.fields: Dict[str, Dict[str, Any]] = {}
 
-    def node_ui(self, has_inputs: bool = True, has_config: bool = True) -> None:
-        """
-        Create the visual representation of the node in the editor.
-
-        Generates a node with:
-        - Input/output connection points (attributes)
-        - Delete and Edit buttons
-        - Execute button
-        - Status text display
-
-        Args:
-            has_inputs: Whether the node accepts input connections
-            has_config: Whether the node has configurable fields (shows Edit button)
-        """
-        # Position node at mouse cursor (offset slightly downward)
-        mouse_pos = dpg.get_mouse_pos(local=False)
-        mouse_pos[1] = mouse_pos[1] - 100
-        mouse_pos[0] = mouse_pos[0] - 100
-        self.pos = mouse_pos
-
-        # Create the main node container
-        with dpg.node(
-            label=f"{self.name}",
-            pos=self.pos,
-            tag=self.id,
-            parent=self.parent,
-        ):
-            # ----------------------------------------------------------------
-            # Input Attribute (top connection point)
-            # ----------------------------------------------------------------
-            with dpg.node_attribute(
-                tag=f"{self.id}_input_attr",
-                shape=dpg.mvNode_PinShape_Circle,
-                attribute_type=(
-                    dpg.mvNode_Attr_Input if has_inputs else dpg.mvNode_Attr_Static
-                ),
-            ):
-                # Action buttons row
-
-                # Execute button - triggers node execution
-                dpg.add_button(
-                    label="Edit",
-                    callback=lambda: self.show_inspector(),
-                    width=210,
-                    tag=f"{self.id}_edit_btn",
-                    show=has_config,
-                )
-                dpg.bind_item_theme(f"{self.id}_edit_btn", "context_button_theme")
-
-                with dpg.group(horizontal=True):
-                    # Delete button - removes this node from the editor
-                    dpg.add_button(
-                        label="Delete",
-                        callback=lambda: self.delete(),
-                        width=100,
-                        tag=f"{self.id}_delete_btn",
-                    )
-                    dpg.bind_item_theme(f"{self.id}_delete_btn", "delete_button_theme")
-
-                    dpg.add_button(
-                        label="Rename",
-                        callback=lambda: self.show_rename_popup(),
-                        width=100,
-                        tag=f"{self.id}_rename_btn",
-                        show=True,
-                    )
-                    dpg.bind_item_theme(f"{self.id}_rename_btn", "context_button_theme")
-
-                # Execute button - triggers node execution
-                dpg.add_button(
-                    label="Execute",
-                    callback=lambda: self.exec_callback(self.id),
-                    width=210,
-                    tag=f"{self.id}_execute_btn",
-                    show=True,
-                )
-                dpg.bind_item_theme(f"{self.id}_execute_btn", "execute_button_theme")
-
-            # ----------------------------------------------------------------
-            # Output Attribute (bottom connection point)
-            # ----------------------------------------------------------------
-            with dpg.node_attribute(
-                tag=f"{self.id}_output_attr",
-                shape=dpg.mvNode_PinShape_Triangle,
-                attribute_type=dpg.mvNode_Attr_Output,
-            ):
-                # Status text showing node ID (last 8 characters)
-                dpg.add_text(
-                    default_value="-", tag=f"{self.id}_state", color=(86, 145, 193)
-                )
-                with dpg.group(horizontal=True):
-                    dpg.add_text(
-                        bullet=True,
-                        default_value=f"{self.id}",
-                        tag=f"{self.id}_id",
-                        color=(86, 145, 193),
-                    )
-                    dpg.add_loading_indicator(
-                        style=1,
-                        radius=1.5,
-                        show=False,
-                        tag=f"{self.id}_loading",
-                    )
-                    with dpg.tooltip(parent=f"{self.id}_id"):
-                        dpg.add_text(
-                            default_value=" Use ID to reference node.",
-                            # color=(101, 122, 231),
-                            tag=f"{self.id}_id_tooltip",
-                        )
-                    dpg.add_text(
-                        default_value=self.status,
-                        color=(101, 122, 231),
-                        tag=f"{self.id}_exec_status",
-                    )
-
     def node_configure(self) -> None:
         """
         Initialize node state from field definitions.
@@ -198,193 +125,373 @@ class NodeBase(ABC):
 
         self.state = state
 
-        # Debug output
-        console.print(f"[green]Configured node: {self.name}[/green]")
-        console.print(f"  State: {self.state}")
-
-    def setup_node_inspector(self) -> None:
-        """
-        Create the inspector window for editing node properties.
-
-        Dynamically generates UI inputs based on field types:
-        - str: Single-line text input
-        - LongString: Multi-line text area
-        - Enum: Dropdown combo box
-        - int: Integer input
-        - float: Float input
-        """
-        with dpg.window(
-            label=f"{self.name} Inspector",
-            modal=True,
-            show=False,
-            tag=f"{self.id}_inspector",
-            no_title_bar=True,
-            pos=self.pos,
-        ):
-            # ----------------------------------------------------------------
-            # Header
-            # ----------------------------------------------------------------
-            dpg.add_text(f"{self.name} Configuration", color=(120, 180, 255))
-            dpg.add_separator()
-            dpg.add_spacer(height=5)
-
-            # ----------------------------------------------------------------
-            # Generate input fields dynamically based on field types
-            # ----------------------------------------------------------------
-            for field_key, field_data in self.fields.items():
-                field_type = field_data["type"]
-                field_value = field_data["value"]
-                field_label = field_data.get("label", field_key.capitalize())
-                field_tag = f"{self.id}_{field_key}"
-
-                # Single-line string input
-                if field_type == str:
-                    dpg.add_input_text(
-                        label=field_label,
-                        tag=field_tag,
-                        default_value=field_value,
-                        width=300,
-                    )
-
-                # Multi-line string input (text area)
-                elif field_type == LongString:
-                    dpg.add_input_text(
-                        label=field_label,
-                        tag=field_tag,
-                        default_value=field_value,
-                        multiline=True,
-                        height=150,
-                        width=300,
-                    )
-
-                # Enum dropdown selector
-                elif isinstance(field_type, type) and issubclass(field_type, Enum):
-                    enum_values = [e.value for e in field_type]
-                    dpg.add_combo(
-                        items=enum_values,
-                        label=field_label,
-                        tag=field_tag,
-                        default_value=field_value,
-                        width=300,
-                    )
-
-                # Integer input
-                elif field_type == int:
-                    dpg.add_input_int(
-                        label=field_label,
-                        tag=field_tag,
-                        default_value=field_value,
-                        width=300,
-                    )
-
-                # Float input
-                elif field_type == float:
-                    dpg.add_input_float(
-                        label=field_label,
-                        tag=field_tag,
-                        default_value=field_value,
-                        width=300,
-                    )
-
-                dpg.add_spacer(height=5)
-
-            # ----------------------------------------------------------------
-            # Footer buttons
-            # ----------------------------------------------------------------
-            dpg.add_separator()
-            with dpg.group(horizontal=True):
-                dpg.add_button(label="Save", callback=lambda: self.save(), width=180)
-                dpg.add_button(
-                    label="Cancel", callback=lambda: self.close_inspector(), width=180
-                )
-
-        with dpg.window(
-            label=f"{self.name} Rename",
-            popup=True,
-            show=False,
-            tag=f"{self.id}_rename_popup",
-            height=30,
-            no_title_bar=True,
-            pos=self.pos,
-        ):
-            dpg.add_input_text(
-                default_value=self.name,
-                tag=f"{self.id}_rename_text",
-                label="Enter New Name",
-            )
-            dpg.add_button(
-                label="Save",
-                tag=f"{self.id}_rename_save_btn",
-                callback=lambda: self.close_rename_popup(),
-            )
-
-    def show_inspector(self) -> None:
-        """
-        Display the inspector window near the node.
-
-        Positions the inspector at the node's current location
-        for convenient editing.
-        """
-        # Get node position and set inspector position
-        node_pos = dpg.get_item_pos(self.id)
-        inspector_pos = [node_pos[0], node_pos[1]]
-
-        dpg.configure_item(item=f"{self.id}_inspector", pos=inspector_pos, show=True)
-
-    def close_inspector(self) -> None:
-        """Hide the inspector window without saving changes."""
-        dpg.configure_item(f"{self.id}_inspector", show=False)
-
-    def show_rename_popup(self):
-        node_pos = dpg.get_item_pos(self.id)
-        popup_pos = [node_pos[0], node_pos[1]]
-
-        dpg.configure_item(item=f"{self.id}_rename_popup", pos=popup_pos, show=True)
-
-    def close_rename_popup(self):
-
-        self.name = dpg.get_value(f"{self.id}_rename_text")
-        dpg.configure_item(f"{self.id}", label=self.name)
-        dpg.configure_item(f"{self.id}_rename_popup", show=False)
-
-    @abstractmethod
-    def save(self) -> None:
-        """
-        Save changes from the inspector back to the node state.
-
-        Must be implemented by subclasses to handle saving
-        field values from UI inputs.
-        """
-        raise NotImplementedError
-
-    @abstractmethod
-    def execute(self) -> None:
-        """
-        Execute the node's primary function.
+        # Debug output (rich renders even when quiet: skip it during bulk loads)
+        if not console.quiet:
+            console.print(f"[green]Configured node: {self.name}[/green]")
+            console.print(f"  State: {self.state}")
+
+    @property
+    def input_attr(self) -> str:
+        """Alias of the node's input attribute (link endpoint)."""
+        return f"{self.id}_input_attr"
+
+    @property
+    def output_attr(self) -> str:
+        """Alias of the node's output attribute (link endpoint)."""
+        return f"{self.id}_output_attr"
+
+    def update(self, values: Dict[str, Any]) -> None:
+        """
+        Apply edited field values and invalidate the node's outputs.
+
+        Args:
+            values: New values keyed by field name; unknown keys are ignored
+        """
+        for field_key, value in values.items():
+            if field_key in self.fields:
+                self.state[field_key] = value
+        self.mark_dirty()
+
+    def summary(self) -> str:
+        """Short description of the configuration shown on the node."""
+        if not self.summary_fields:
+            return "-"
+        return "\n".join(str(self.state.get(key, "")) for key in self.summary_fields)
+
+    def execute(self) -> Any:
+        """
+        Execute the node's primary function for one input item.
+
+        Subclasses implement execute(), a native aexecute(), or both, to
+        define the node's behavior when the Execute button is clicked;
+        nodes with only aexecute() always run on the event loop. When
+        called, state holds the field values resolved for the current
+        item, with the item itself under state["input"]. The return value
+        becomes the node's output item (a dict), or several items when a
+        list is returned; None produces no output. execute() may also be
+        a generator yielding output items, which lets streaming
+        executions pass each item downstream as soon as it is produced.
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} implements neither execute() nor aexecute()"
+        )
+
+    async def aexecute(self) -> Any:
+        """
+        Execute the node's primary function asynchronously.
+
+        I/O-bound nodes may override this with a native coroutine so many
+        requests can wait on a single event loop, or with an async
+        generator yielding output items. The default adapter runs the
+        synchronous execute() on a worker thread.
+        """
+        return await asyncio.to_thread(self.execute)
+
+    def resolve_state(
+        self, item: Dict[str, Any], items: List[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """
+        Resolve the node's field expressions against an input item.
+
+        Args:
+            item: Input item being processed
+            items: All input items of this execution
+
+        Returns:
+            State dictionary for the item, with the item under "input"
+
+        Raises:
+            ValueError: If a {{ ... }} expression cannot be resolved
+        """
+        values = {key: value for key, value in self.state.items() if key != "input"}
+        resolved, errors = resolve_fields(values, build_scope(item, items, values))
+        if errors:
+            raise ValueError("; ".join(errors))
+
+        resolved["input"] = item
+        return resolved
+
+    def bind_item(
+        self, item: Dict[str, Any], items: List[Dict[str, Any]]
+    ) -> "NodeBase":
+        """
+        Return a copy of the node with its state resolved for one item.
+
+        The live node is never rebound: executions run on the copy, so
+        edits made while a run is in progress land on the live node's
+        state (and mark it dirty) instead of being overwritten.
+
+        Raises:
+            ValueError: If a {{ ... }} expression cannot be resolved
+        """
+        node = copy.copy(self)
+        node.state = self.resolve_state(item, items)
+        return node
+
+    def execute_item(
+        self, item: Dict[str, Any], items: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Execute one input item (see bind_item) and collect output items."""
+        return list(self.iter_item(item, items))
+
+    async def aexecute_item(
+        self, item: Dict[str, Any], items: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Async counterpart of execute_item() built on aexecute()."""
+        outputs = []
+        async for output in self.aiter_item(item, items):
+            outputs.append(output)
+        return outputs
+
+    def iter_item(
+        self, item: Dict[str, Any], items: List[Dict[str, Any]]
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Like execute_item(), but yield output items as they are produced.
+
+        Generator nodes are consumed lazily, so a streaming execution can
+        forward each output before the next one is computed.
+        """
+        node = self.bind_item(item, items)
+        key = node.cache_key()
+        if key is not None:
+            hit, outputs = node.result_cache.get(key)
+            if hit:
+                yield from outputs
+                return
+
+        outputs = []
+        result = node.execute()
+        if inspect.isgenerator(result):
+            for output in result:
+                for out in as_items(output):
+                    outputs.append(out)
+                    yield out
+        else:
+            outputs = as_items(result)
+            yield from outputs
+
+        if key is not None:
+            node.result_cache.put(key, outputs, ttl=node.cache_ttl)
+
+    async def aiter_item(
+        self, item: Dict[str, Any], items: List[Dict[str, Any]]
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Async counterpart of iter_item() built on aexecute()."""
+        node = self.bind_item(item, items)
+        key = node.cache_key()
+        if key is not None:
+            hit, outputs = node.result_cache.get(key)
+            if hit:
+                for out in outputs:
+                    yield out
+                return
+
+        outputs = []
+        result = node.aexecute()
+        if inspect.isasyncgen(result):
+            async for output in result:
+                for out in as_items(output):
+                    outputs.append(out)
+                    yield out
+        else:
+            outputs = as_items(await result)
+            for out in outputs:
+                yield out
+
+        if key is not None:
+            node.result_cache.put(key, outputs, ttl=node.cache_ttl)
+
+    def is_cacheable(self) -> bool:
+        """
+        Whether the current (resolved) state may be served from the cache.
+
+        Defaults to the type's cacheable flag; node types override this to
+        exclude requests with side effects.
+        """
+        return self.cacheable
+
+    def cache_key(self) -> Optional[str]:
+        """
+        Content key of the current resolved state, or None when not cached.
+
+        The key hashes the node type with the resolved fields and input
+        item, so identical work maps to the same entry across nodes and runs.
+        """
+        if self.result_cache is None or not self.is_cacheable():
+            return None
+        return content_key(type(self).__name__, self.state)
+
+    def execute_batch(
+        self, batch: List[Dict[str, Any]], items: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Execute a batch of input items and return their output items.
+
+        The default runs execute_item() for each item in turn. Nodes that
+        can vectorize or pool their work (e.g. one request for many items)
+        override this and set batch_size.
 
-        Must be implemented by subclasses to define the node's
-        behavior when the Execute button is clicked.
+        Args:
+            batch: Input items to process in this call
+            items: All input items of this execution
         """
-        raise NotImplementedError
+        outputs = []
+        for item in batch:
+            outputs.extend(self.execute_item(item, items))
+        return outputs
+
+    async def aexecute_batch(
+        self, batch: List[Dict[str, Any]], items: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Async counterpart of execute_batch() built on aexecute_item()."""
+        outputs = []
+        for item in batch:
+            outputs.extend(await self.aexecute_item(item, items))
+        return outputs
+
+    def batches(self, items: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+        """Split input items into chunks of batch_size."""
+        size = self.batch_size if self.batch_size > 0 else max(len(items), 1)
+        return [items[i : i + size] for i in range(0, len(items), size)]
+
+    def run_items(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Execute the node once per input item (or once per batch).
+
+        Args:
+            items: Input items collected from upstream nodes
 
-    def delete(self) -> None:
+        Returns:
+            Output items, in input order
         """
-        Delete this node and cleanup associated resources.
+        outputs = []
+        for batch in self.batches(items):
+            outputs.extend(self.execute_batch(batch, items))
+        return outputs
+
+    async def arun_items(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Async counterpart of run_items() for nodes with a native aexecute()."""
+        outputs = []
+        for batch in self.batches(items):
+            outputs.extend(await self.aexecute_batch(batch, items))
+        return outputs
+
+    def references_inputs(self) -> bool:
+        """Whether a field expression reads the node's input items ($input)."""
+        return any(
+            isinstance(value, str) and "$input" in value
+            for value in self.state.values()
+        )
+
+    def trace_fields(self, outputs: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Extra fields recorded in the node's execution trace.
+
+        Computed from the output items, so it works for every execution
+        mode (including process mode, where the executing copy of the node
+        is not visible to the executor). Streaming runs that do not retain
+        a node's outputs call it per chunk of outputs and sum the fields,
+        so they should be counters. The default records nothing.
 
-        Removes the inspector window and the node itself from
-        the DearPyGui context.
+        Args:
+            outputs: Output items of the execution
         """
-        # Delete the inspector window if it exists
-        if dpg.does_item_exist(f"{self.id}_inspector"):
-            dpg.delete_item(f"{self.id}_inspector")
+        return {}
 
-        # Delete the node itself
-        if dpg.does_item_exist(self.id):
-            dpg.delete_item(self.id)
+    @property
+    def has_native_async(self) -> bool:
+        """Whether this node type overrides aexecute() with its own coroutine."""
+        return type(self).aexecute is not NodeBase.aexecute
 
-        self.delete_cb(self.id)
+    def serialize(self) -> bytes:
+        """
+        Serialize the node for execution in another process.
 
-        console.print(f"[yellow]Deleted node: {self.name} ({self.id[-8:]})[/yellow]")
+        Only the node type, identity and resolved state cross the process
+        boundary; UI items and callbacks stay behind.
+        """
+        return pickle.dumps((type(self), self.id, self.name, self.state))
 
-    def set_callback(self, callback):
-        self.exec_callback = callback
+    @staticmethod
+    def deserialize(data: bytes) -> "NodeBase":
+        """
+        Rebuild a node from serialize() output without creating any UI.
+
+        The returned instance only carries state and can only be executed.
+        """
+        node_cls, node_id, name, state = pickle.loads(data)
+        node = node_cls.__new__(node_cls)
+        node.id = node_id
+        node.name = name
+        node.status = "RUNNING"
+        node.is_dirty = True
+        node.edit_version = 0
+        node.change_cb = None
+        node.result_cache = None
+        node.state = state
+        node.fields = {}
+        return node
+
+    def mark_dirty(self) -> None:
+        """
+        Invalidate the node's last outputs after its configuration changed.
+
+        The change callback (set by the application) propagates the
+        invalidation to every descendant.
+        """
+        self.mark_stale()
+        if self.change_cb is not None:
+            self.change_cb(self.id)
+
+    def mark_stale(self) -> None:
+        """Flag the last outputs as stale (no propagation)."""
+        self.is_dirty = True
+        self.edit_version += 1
+
+    def mark_clean(self, version: int) -> bool:
+        """
+        Clear the dirty flag after a run that started at edit_version.
+
+        Edits or relinks made while the node was executing leave it dirty,
+        since its outputs reflect the configuration it was dispatched with.
+
+        Returns:
+            Whether the node is now clean
+        """
+        if self.edit_version == version:
+            self.is_dirty = False
+        return not self.is_dirty
+
+
+def as_items(result: Any) -> List[Dict[str, Any]]:
+    """
+    Normalize an execute() return value to a list of output items.
+
+    None yields no items, a list or generator yields its elements and any
+    other value is a single item; non-dict values are wrapped as
+    {"value": result}.
+    """
+    if result is None:
+        return []
+    if inspect.isgenerator(result):
+        result = list(result)
+    elif not isinstance(result, list):
+        result = [result]
+    return [item if isinstance(item, dict) else {"value": item} for item in result]
+
+
+def execute_serialized(
+    data: bytes, items: List[Dict[str, Any]]
+) -> List[Dict[str, Any]]:
+    """
+    Process pool entry point: rebuild a serialized node and run its items.
+
+    Args:
+        data: Output of NodeBase.serialize()
+        items: Input items for the node
+
+    Returns:
+        The node's output items
+    """
+    return NodeBase.deserialize(data).run_items(items)
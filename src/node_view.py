@@ -0,0 +1,374 @@
+import dearpygui.dearpygui as dpg
+from enum import Enum
+
+from .node_base import LongString, NodeBase, console
+
+
+class NodeView:
+    """
+    Editor view of a node.
+
+    Renders a NodeBase model in the DearPyGui node editor together with
+    its inspector and rename windows, and writes edits back to the model.
+    The model itself holds no GUI references, so it can execute headless.
+
+    Attributes:
+        node (NodeBase): Node model shown by this view
+        parent (str): Tag of the parent DearPyGui container
+        exec_callback: Called with the node id when Execute is clicked
+        delete_cb: Called with the node id after the node was deleted
+    """
+
+    def __init__(
+        self, node: NodeBase, parent: str, exec_cb, delete_cb, at_mouse: bool = True
+    ) -> None:
+        """
+        Create the node's editor items.
+
+        Args:
+            node: Node model to render
+            parent: Tag of the parent DearPyGui container (node editor)
+            exec_cb: Execute button callback
+            delete_cb: Delete button callback
+            at_mouse: Place the node at the mouse cursor instead of node.pos
+        """
+        self.node = node
+        self.parent = parent
+        self.exec_callback = exec_cb
+        self.delete_cb = delete_cb
+
+        if at_mouse:
+            # Position node at mouse cursor (offset slightly downward)
+            mouse_pos = dpg.get_mouse_pos(local=False)
+            node.pos = [mouse_pos[0] - 100, mouse_pos[1] - 100]
+
+        self.node_ui(has_inputs=node.has_inputs, has_config=node.has_config)
+        dpg.set_value(f"{node.id}_state", value=node.summary())
+        self.setup_node_inspector()
+
+    def node_ui(self, has_inputs: bool = True, has_config: bool = True) -> None:
+        """
+        Create the visual representation of the node in the editor.
+
+        Generates a node with:
+        - Input/output connection points (attributes)
+        - Delete and Edit buttons
+        - Execute button
+        - Status text display
+
+        Args:
+            has_inputs: Whether the node accepts input connections
+            has_config: Whether the node has configurable fields (shows Edit button)
+        """
+        # Create the main node container
+        with dpg.node(
+            label=f"{self.node.name}",
+            pos=self.node.pos,
+            tag=self.node.id,
+            parent=self.parent,
+        ):
+            # ----------------------------------------------------------------
+            # Input Attribute (top connection point)
+            # ----------------------------------------------------------------
+            with dpg.node_attribute(
+                tag=self.node.input_attr,
+                shape=dpg.mvNode_PinShape_Circle,
+                attribute_type=(
+                    dpg.mvNode_Attr_Input if has_inputs else dpg.mvNode_Attr_Static
+                ),
+            ):
+                # Action buttons row
+
+                # Execute button - triggers node execution
+                dpg.add_button(
+                    label="Edit",
+                    callback=lambda: self.show_inspector(),
+                    width=210,
+                    tag=f"{self.node.id}_edit_btn",
+                    show=has_config,
+                )
+                dpg.bind_item_theme(f"{self.node.id}_edit_btn", "context_button_theme")
+
+                with dpg.group(horizontal=True):
+                    # Delete button - removes this node from the editor
+                    dpg.add_button(
+                        label="Delete",
+                        callback=lambda: self.delete(),
+                        width=100,
+                        tag=f"{self.node.id}_delete_btn",
+                    )
+                    dpg.bind_item_theme(
+                        f"{self.node.id}_delete_btn", "delete_button_theme"
+                    )
+
+                    dpg.add_button(
+                        label="Rename",
+                        callback=lambda: self.show_rename_popup(),
+                        width=100,
+                        tag=f"{self.node.id}_rename_btn",
+                        show=True,
+                    )
+                    dpg.bind_item_theme(
+                        f"{self.node.id}_rename_btn", "context_button_theme"
+                    )
+
+                # Execute button - triggers node execution
+                dpg.add_button(
+                    label="Execute",
+                    callback=lambda: self.exec_callback(self.node.id),
+                    width=210,
+                    tag=f"{self.node.id}_execute_btn",
+                    show=True,
+                )
+                dpg.bind_item_theme(
+                    f"{self.node.id}_execute_btn", "execute_button_theme"
+                )
+
+            # ----------------------------------------------------------------
+            # Output Attribute (bottom connection point)
+            # ----------------------------------------------------------------
+            with dpg.node_attribute(
+                tag=self.node.output_attr,
+                shape=dpg.mvNode_PinShape_Triangle,
+                attribute_type=dpg.mvNode_Attr_Output,
+            ):
+                # Status text showing node ID (last 8 characters)
+                dpg.add_text(
+                    default_value="-", tag=f"{self.node.id}_state", color=(86, 145, 193)
+                )
+                with dpg.group(horizontal=True):
+                    dpg.add_text(
+                        bullet=True,
+                        default_value=f"{self.node.id}",
+                        tag=f"{self.node.id}_id",
+                        color=(86, 145, 193),
+                    )
+                    dpg.add_loading_indicator(
+                        style=1,
+                        radius=1.5,
+                        show=False,
+                        tag=f"{self.node.id}_loading",
+                    )
+                    with dpg.tooltip(parent=f"{self.node.id}_id"):
+                        dpg.add_text(
+                            default_value=" Use ID to reference node.",
+                            # color=(101, 122, 231),
+                            tag=f"{self.node.id}_id_tooltip",
+                        )
+                    dpg.add_text(
+                        default_value=self.node.status,
+                        color=(101, 122, 231),
+                        tag=f"{self.node.id}_exec_status",
+                    )
+
+    def setup_node_inspector(self) -> None:
+        """
+        Create the inspector window for editing node properties.
+
+        Dynamically generates UI inputs based on field types:
+        - str: Single-line text input
+        - LongString: Multi-line text area
+        - Enum: Dropdown combo box
+        - int: Integer input
+        - float: Float input
+        """
+        with dpg.window(
+            label=f"{self.node.name} Inspector",
+            modal=True,
+            show=False,
+            tag=f"{self.node.id}_inspector",
+            no_title_bar=True,
+            pos=self.node.pos,
+        ):
+            # ----------------------------------------------------------------
+            # Header
+            # ----------------------------------------------------------------
+            dpg.add_text(f"{self.node.name} Configuration", color=(120, 180, 255))
+            dpg.add_separator()
+            dpg.add_spacer(height=5)
+
+            # ----------------------------------------------------------------
+            # Generate input fields dynamically based on field types
+            # ----------------------------------------------------------------
+            for field_key, field_data in self.node.fields.items():
+                field_type = field_data["type"]
+                field_value = self.node.state.get(field_key, field_data["value"])
+                field_label = field_data.get("label", field_key.capitalize())
+                field_tag = f"{self.node.id}_{field_key}"
+
+                # Single-line string input
+                if field_type == str:
+                    dpg.add_input_text(
+                        label=field_label,
+                        tag=field_tag,
+                        default_value=field_value,
+                        width=300,
+                    )
+
+                # Multi-line string input (text area)
+                elif field_type == LongString:
+                    dpg.add_input_text(
+                        label=field_label,
+                        tag=field_tag,
+                        default_value=field_value,
+                        multiline=True,
+                        height=150,
+                        width=300,
+                    )
+
+                # Enum dropdown selector
+                elif isinstance(field_type, type) and issubclass(field_type, Enum):
+                    enum_values = [e.value for e in field_type]
+                    dpg.add_combo(
+                        items=enum_values,
+                        label=field_label,
+                        tag=field_tag,
+                        default_value=field_value,
+                        width=300,
+                    )
+
+                # Integer input
+                elif field_type == int:
+                    dpg.add_input_int(
+                        label=field_label,
+                        tag=field_tag,
+                        default_value=field_value,
+                        width=300,
+                    )
+
+                # Float input
+                elif field_type == float:
+                    dpg.add_input_float(
+                        label=field_label,
+                        tag=field_tag,
+                        default_value=field_value,
+                        width=300,
+                    )
+
+                dpg.add_spacer(height=5)
+
+            # ----------------------------------------------------------------
+            # Footer buttons
+            # ----------------------------------------------------------------
+            dpg.add_separator()
+            with dpg.group(horizontal=True):
+                dpg.add_button(label="Save", callback=lambda: self.save(), width=180)
+                dpg.add_button(
+                    label="Cancel", callback=lambda: self.close_inspector(), width=180
+                )
+
+        with dpg.window(
+            label=f"{self.node.name} Rename",
+            popup=True,
+            show=False,
+            tag=f"{self.node.id}_rename_popup",
+            height=30,
+            no_title_bar=True,
+            pos=self.node.pos,
+        ):
+            dpg.add_input_text(
+                default_value=self.node.name,
+                tag=f"{self.node.id}_rename_text",
+                label="Enter New Name",
+            )
+            dpg.add_button(
+                label="Save",
+                tag=f"{self.node.id}_rename_save_btn",
+                callback=lambda: self.close_rename_popup(),
+            )
+
+    def show_inspector(self) -> None:
+        """
+        Display the inspector window near the node.
+
+        Positions the inspector at the node's current location
+        for convenient editing.
+        """
+        # Get node position and set inspector position
+        node_pos = dpg.get_item_pos(self.node.id)
+        inspector_pos = [node_pos[0], node_pos[1]]
+
+        dpg.configure_item(
+            item=f"{self.node.id}_inspector", pos=inspector_pos, show=True
+        )
+
+    def close_inspector(self) -> None:
+        """Hide the inspector window without saving changes."""
+        dpg.configure_item(f"{self.node.id}_inspector", show=False)
+
+    def show_rename_popup(self):
+        node_pos = dpg.get_item_pos(self.node.id)
+        popup_pos = [node_pos[0], node_pos[1]]
+
+        dpg.configure_item(
+            item=f"{self.node.id}_rename_popup", pos=popup_pos, show=True
+        )
+
+    def close_rename_popup(self):
+
+        self.node.name = dpg.get_value(f"{self.node.id}_rename_text")
+        dpg.configure_item(f"{self.node.id}", label=self.node.name)
+        dpg.configure_item(f"{self.node.id}_rename_popup", show=False)
+
+    def delete(self) -> None:
+        """
+        Delete this node and cleanup associated resources.
+
+        Removes the node's editor items and hands the node id to the
+        delete callback so the engine drops it too.
+        """
+        self.remove()
+        self.delete_cb(self.node.id)
+
+        console.print(
+            f"[yellow]Deleted node: {self.node.name} ({self.node.id[-8:]})[/yellow]"
+        )
+
+    def remove(self) -> None:
+        """Remove the node's editor items, leaving the model untouched."""
+        for tag in (
+            f"{self.node.id}_inspector",
+            f"{self.node.id}_rename_popup",
+            self.node.id,
+        ):
+            if dpg.does_item_exist(tag):
+                dpg.delete_item(tag)
+
+    def save(self) -> None:
+        """
+        Save changes from inspector inputs back to node state.
+
+        Updates the model from the UI input values (which invalidates its
+        outputs) and refreshes the status display on the node.
+        """
+        # Update state from UI input values
+        values = {
+            field_key: dpg.get_value(item=f"{self.node.id}_{field_key}")
+            for field_key in self.node.fields.keys()
+        }
+        self.node.update(values)
+
+        # Update the status display on the node
+        dpg.set_value(f"{self.node.id}_state", value=self.node.summary())
+
+        # Debug output
+        console.print(f"[cyan]Saved node: {self.node.id[-8:]}[/cyan]")
+        console.print(f"  State: {self.node.state}")
+
+        # Close the inspector
+        self.close_inspector()
+
+    def set_status(self, status: str, color) -> None:
+        """
+        Show an execution status on the node.
+
+        Args:
+            status: Status text (PENDING, RUNNING, COMPLETED, ERROR)
+            color: RGB color of the status text
+        """
+        dpg.set_value(item=f"{self.node.id}_exec_status", value=status)
+        dpg.configure_item(item=f"{self.node.id}_exec_status", color=color)
+        if status == "RUNNING":
+            dpg.configure_item(item=f"{self.node.id}_loading", show=True, color=color)
+        else:
+            dpg.configure_item(item=f"{self.node.id}_loading", show=False)
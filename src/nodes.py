@@ -1,5 +1,89 @@
 
+import gzip
+import json
+import threading
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+from .cache import ResponseStore
+from .http_cache import HTTPCache, get_header
+from .http_pool import (
+    ACCEPT_ENCODING,
+    DecodingReader,
+    HTTPStatusError,
+    http_pool,
+)
 from .node_base import *
+from .spool import SpooledBody, read_body
+
+# Location of durable caches (override with LIGHTHOUSE_CACHE_DIR)
+CACHE_DIR = os.environ.get(
+    "LIGHTHOUSE_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".lighthouse")
+)
+
+# Large HTTP response bodies are streamed here (see src/spool.py)
+SPOOL_DIR = os.path.join(CACHE_DIR, "spool")
+
+_chat_store: Optional[ResponseStore] = None
+_chat_store_lock = threading.Lock()
+
+
+def chat_response_store() -> ResponseStore:
+    """
+    Return the process-wide durable store for chat model responses.
+
+    The store is opened lazily so nodes that never call a model do not
+    touch the disk.
+    """
+    global _chat_store
+    with _chat_store_lock:
+        if _chat_store is None:
+            _chat_store = ResponseStore(
+                os.path.join(CACHE_DIR, "chat_responses.sqlite3")
+            )
+        return _chat_store
+
+
+_http_cache: Optional[HTTPCache] = None
+_http_cache_lock = threading.Lock()
+
+
+def http_cache() -> HTTPCache:
+    """
+    Return the process-wide HTTP cache for GET responses.
+
+    Opened lazily, like chat_response_store(); entries are bounded by the
+    store's size limit and compacted in the background.
+    """
+    global _http_cache
+    with _http_cache_lock:
+        if _http_cache is None:
+            _http_cache = HTTPCache(
+                ResponseStore(os.path.join(CACHE_DIR, "http_cache.sqlite3"))
+            )
+        return _http_cache
+
+
+def decode_body(data: bytes, content_type: str) -> Any:
+    """
+    Decode a response body by its Content-Type.
+
+    Returns:
+        Parsed JSON for JSON responses, otherwise the body as text
+    """
+    charset = "utf-8"
+    for param in content_type.split(";")[1:]:
+        name, _, value = param.strip().partition("=")
+        if name.lower() == "charset" and value:
+            charset = value.strip('"')
+
+    text = data.decode(charset, errors="replace")
+    if "json" in content_type.lower() and text.strip():
+        try:
+            return json.loads(text)
+        except ValueError:
+            pass
+    return text
 
 
 # ============================================================================
@@ -34,15 +118,19 @@ class ManualTriggerNode(NodeBase):
     It can be executed manually to trigger downstream nodes.
     """
 
-    def __init__(self, name: str, parent: str, exec_cb, delete_cb) -> None:
+    execution_mode = ExecutionMode.INLINE
+    has_inputs = False
+    has_config = False
+
+    def __init__(self, name: str, node_id: Optional[str] = None) -> None:
         """
         Initialize a Manual Trigger node.
 
         Args:
             name: Display name for the node
-            parent: Tag of the parent node editor
+            node_id: Identifier to restore (a new one is generated if None)
         """
-        super().__init__(name, parent, exec_cb, delete_cb)
+        super().__init__(name, node_id)
 
         # Define node fields
         self.fields = {
@@ -53,23 +141,28 @@ class ManualTriggerNode(NodeBase):
             },
         }
 
-        # Initialize the node UI and configuration
-        self.node_ui(has_inputs=False, has_config=False)
+        # Initialize the node state
         self.node_configure()
-        self.setup_node_inspector()
-
-    def save(self) -> None:
-        """Save method (no-op for trigger nodes with no config)."""
-        pass
 
     def execute(self) -> Dict[str, Any]:
         """
         Execute the manual trigger.
 
         Returns:
-            Current node state
+            The input item when the run was given source items (e.g. from
+            src/run.py --inputs), otherwise the current node state
         """
-        return self.state
+        return self.state["input"] or self.state
+
+
+# Byte counters of an HTTP request: request body before and after
+# compression, response body as received and after decoding
+TRANSFER_COUNTERS = (
+    "request_bytes",
+    "request_wire_bytes",
+    "response_wire_bytes",
+    "response_bytes",
+)
 
 
 class HTTPRequestNode(NodeBase):
@@ -84,17 +177,35 @@ class HTTPRequestNode(NodeBase):
         type: HTTP method (GET, POST, etc.)
         body: Request body content (JSON format)
         timeout: Request timeout in seconds
+        concurrency: Requests in flight at once when fanning out
+        spool_mb: Responses larger than this (in MB) are streamed to a
+            spool file and passed on as a SpooledBody handle
+        compress_kb: Request bodies larger than this (in KB) are sent
+            gzip-compressed (0 disables; the server must accept it)
+
+    All input items of a run are handled in one call (batch_size = 0): one
+    request per item, up to concurrency at a time, with the output items
+    in input order. A failed request yields an item with its status and
+    error instead of failing the node, unless every request failed.
+
+    GET responses go through the HTTP cache (see http_cache): fresh
+    entries are served without a request and stale ones are revalidated
+    with their ETag / Last-Modified validators, as the server's
+    Cache-Control and Expires headers allow.
     """
 
-    def __init__(self, name: str, parent: str, exec_cb, delete_cb) -> None:
+    batch_size = 0
+    summary_fields = ("type", "url")
+
+    def __init__(self, name: str, node_id: Optional[str] = None) -> None:
         """
         Initialize an HTTP Request node.
 
         Args:
             name: Display name for the node
-            parent: Tag of the parent node editor
+            node_id: Identifier to restore (a new one is generated if None)
         """
-        super().__init__(name, parent, exec_cb, delete_cb)
+        super().__init__(name, node_id)
 
         # Define the fields for this node type
         self.fields = {
@@ -118,44 +229,208 @@ class HTTPRequestNode(NodeBase):
                 "type": int,
                 "label": "Timeout (seconds)",
             },
+            "concurrency": {
+                "value": 8,
+                "type": int,
+                "label": "Concurrent requests",
+            },
+            "spool_mb": {
+                "value": 8,
+                "type": int,
+                "label": "Spool to disk above (MB)",
+            },
+            "compress_kb": {
+                "value": 0,
+                "type": int,
+                "label": "Gzip request bodies above (KB, 0: off)",
+            },
         }
 
-        # Initialize the node UI and configuration
-        self.node_ui()
+        # Initialize the node state
         self.node_configure()
-        self.setup_node_inspector()
 
-    def save(self) -> None:
+    def execute(self) -> Dict[str, Any]:
         """
-        Save changes from inspector inputs back to node state.
+        Send the HTTP request on a pooled keep-alive connection.
 
-        Updates the state dictionary with values from UI inputs
-        and refreshes the status display on the node.
+        The body is sent for every method except GET, gzip-compressed if
+        it exceeds compress_kb. gzip/deflate responses are decoded while
+        they stream in. JSON responses are parsed; other responses are
+        decoded as text. Responses larger than spool_mb are streamed to a
+        spool file instead and the body is a SpooledBody (open() / view()
+        read it lazily).
+
+        Returns:
+            Item with the url, method, status, response headers, body,
+            elapsed time in seconds, cache outcome ("hit", "revalidated",
+            "miss", or "bypass" for methods other than GET) and byte
+            counters before and after compression (see trace_fields)
+
+        Raises:
+            HTTPStatusError: If the server answers with a 4xx/5xx status
         """
-        # Update state from UI input values
-        for field_key in self.fields.keys():
-            input_tag = f"{self.id}_{field_key}"
-            self.state[field_key] = dpg.get_value(item=input_tag)
+        method = self.state["type"]
+        url = self.state["url"]
+        body = None
+        headers = {
+            "Accept": "application/json, */*",
+            "Accept-Encoding": ACCEPT_ENCODING,
+        }
+        transfer = dict.fromkeys(TRANSFER_COUNTERS, 0)
+        if method != HTTPRequestType.GET.value and self.state["body"]:
+            body = self.state["body"].encode("utf-8")
+            headers["Content-Type"] = "application/json"
+            transfer["request_bytes"] = len(body)
+            compress_kb = int(self.state["compress_kb"])
+            if compress_kb > 0 and len(body) > compress_kb * 1024:
+                body = gzip.compress(body, compresslevel=6)
+                headers["Content-Encoding"] = "gzip"
+            transfer["request_wire_bytes"] = len(body)
+
+        start = time.perf_counter()
+        cache = http_cache() if method == HTTPRequestType.GET.value else None
+        entry = cache.get(url) if cache is not None else None
+        if entry is not None:
+            if entry.is_fresh():
+                transfer["response_bytes"] = len(entry.body)
+                return self.response_item(
+                    entry.status, entry.headers, entry.body, "hit", start, transfer
+                )
+            headers.update(entry.validators())
+
+        with http_pool().request(
+            method, url, body=body, headers=headers, timeout=self.state["timeout"]
+        ) as response:
+            content_type = response.headers.get("Content-Type", "")
+            reader = DecodingReader(
+                response, response.headers.get("Content-Encoding", "")
+            )
+            threshold = int(float(self.state["spool_mb"]) * 1024 * 1024)
+            data = read_body(reader, threshold, SPOOL_DIR, content_type)
+        # The body is stored and handed on decoded: so are its headers
+        response_headers = reader.decoded_headers(dict(response.headers))
+        transfer["response_wire_bytes"] = reader.wire_bytes
+        transfer["response_bytes"] = reader.decoded_bytes
+
+        if response.status == 304 and entry is not None:
+            entry = cache.refresh(url, entry, response_headers)
+            transfer["response_bytes"] = len(entry.body)
+            return self.response_item(
+                entry.status, entry.headers, entry.body, "revalidated", start, transfer
+            )
+
+        if response.status >= 400:
+            if isinstance(data, SpooledBody):
+                data.delete()
+            raise HTTPStatusError(response.status, response.reason, method, url)
+
+        if cache is None:
+            outcome = "bypass"
+        else:
+            outcome = "miss"
+            # Spooled bodies are too large for the cache
+            if not isinstance(data, SpooledBody):
+                cache.put(url, response.status, response_headers, data)
+        return self.response_item(
+            response.status, response_headers, data, outcome, start, transfer
+        )
 
-        # Update the status display on the node
-        status_text = f"{self.state['type']}\n{self.state['url']}"
-        dpg.set_value(f"{self.id}_state", value=status_text)
+    def response_item(
+        self,
+        status: int,
+        headers: Dict[str, str],
+        data: Any,
+        cache: str,
+        start: float,
+        transfer: Dict[str, int],
+    ) -> Dict[str, Any]:
+        """Build the output item for a response (decoding in-memory bodies)."""
+        if not isinstance(data, SpooledBody):
+            data = decode_body(data, get_header(headers, "Content-Type") or "")
+        return {
+            "url": self.state["url"],
+            "method": self.state["type"],
+            "status": status,
+            "headers": headers,
+            "body": data,
+            "elapsed": time.perf_counter() - start,
+            "cache": cache,
+            "transfer": transfer,
+        }
 
-        # Debug output
-        console.print(f"[cyan]Saved node: {self.id[-8:]}[/cyan]")
-        console.print(f"  State: {self.state}")
+    def trace_fields(self, outputs: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Byte counters of all requests, summed (failed requests excluded)."""
+        totals = dict.fromkeys(TRANSFER_COUNTERS, 0)
+        for output in outputs:
+            for counter, count in output.get("transfer", {}).items():
+                totals[counter] = totals.get(counter, 0) + count
+        return totals
+
+    def execute_batch(
+        self, batch: List[Dict[str, Any]], items: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Send one request per input item, up to concurrency at a time.
 
-        # Close the inspector
-        self.close_inspector()
+        Each item runs on its own copy of the node, so field expressions
+        resolve per item without sharing state between threads. The
+        connection pool additionally caps connections per server.
 
-    def execute(self) -> Dict[str, Any]:
+        Args:
+            batch: Input items to process in this call
+            items: All input items of this execution
+
+        Returns:
+            Output items in input order; failed requests yield an item
+            with url, method, status (None without a response), error and
+            elapsed
+
+        Raises:
+            Exception: The first error, if every request in the batch failed
+        """
+        if not batch:
+            return []
+
+        limit = max(1, min(int(self.state["concurrency"]), len(batch)))
+        with ThreadPoolExecutor(
+            max_workers=limit, thread_name_prefix=f"lighthouse-http-{self.id}"
+        ) as pool:
+            results = list(pool.map(lambda item: self.request_item(item, items), batch))
+
+        if all(error is not None for _, error in results):
+            raise results[0][1]
+
+        outputs = []
+        for item_outputs, _ in results:
+            outputs.extend(item_outputs)
+        return outputs
+
+    def request_item(
+        self, item: Dict[str, Any], items: List[Dict[str, Any]]
+    ) -> Tuple[List[Dict[str, Any]], Optional[Exception]]:
         """
-        Execute the HTTP request (placeholder implementation).
+        Execute one input item, capturing failures.
 
         Returns:
-            Current node state with request configuration
+            Tuple of (output items, error or None)
         """
-        return self.state
+        start = time.perf_counter()
+        try:
+            return self.execute_item(item, items), None
+        except Exception as e:
+            # Resolve again for the item's url/method
+            try:
+                state = self.resolve_state(item, items)
+            except ValueError:
+                state = self.state
+            failed = {
+                "url": state["url"],
+                "method": state["type"],
+                "status": e.status if isinstance(e, HTTPStatusError) else None,
+                "error": str(e),
+                "elapsed": time.perf_counter() - start,
+            }
+            return [failed], e
 
 
 class ExecuteCommandNode(NodeBase):
@@ -170,15 +445,17 @@ class ExecuteCommandNode(NodeBase):
         log_file: Path to log file for command output
     """
 
-    def __init__(self, name: str, parent: str, exec_cb, delete_cb) -> None:
+    summary_fields = ("command", "log_file")
+
+    def __init__(self, name: str, node_id: Optional[str] = None) -> None:
         """
         Initialize an Execute Command node.
 
         Args:
             name: Display name for the node
-            parent: Tag of the parent node editor
+            node_id: Identifier to restore (a new one is generated if None)
         """
-        super().__init__(name, parent, exec_cb, delete_cb)
+        super().__init__(name, node_id)
 
         # Define node fields with default command
         self.fields = {
@@ -194,32 +471,8 @@ class ExecuteCommandNode(NodeBase):
             },
         }
 
-        # Initialize the node UI and configuration
-        self.node_ui()
+        # Initialize the node state
         self.node_configure()
-        self.setup_node_inspector()
-
-    def save(self) -> None:
-        """
-        Save changes from inspector inputs back to node state.
-
-        Updates command and log file path from UI inputs.
-        """
-        # Update state from UI input values
-        for field_key in self.fields.keys():
-            input_tag = f"{self.id}_{field_key}"
-            self.state[field_key] = dpg.get_value(item=input_tag)
-
-        # Update the status display on the node
-        status_text = f"{self.state['command']}\n{self.state['log_file']}"
-        dpg.set_value(f"{self.id}_state", value=status_text)
-
-        # Debug output
-        console.print(f"[cyan]Saved node: {self.id[-8:]}[/cyan]")
-        console.print(f"  State: {self.state}")
-
-        # Close the inspector
-        self.close_inspector()
 
     def execute(self) -> Dict[str, Any]:
         """
@@ -250,17 +503,25 @@ class ChatModelNode(NodeBase):
         timeout: Request timeout in seconds
         system_prompt: System prompt for model behavior
         query: User query to send to the model
+
+    Responses are served from the result cache when the resolved fields
+    and input item are identical to an earlier call, and from the durable
+    response store (see chat_response_store) when the model parameters
+    and prompts match a response from an earlier session.
     """
 
-    def __init__(self, name: str, parent: str, exec_cb, delete_cb) -> None:
+    cacheable = True
+    summary_fields = ("model", "base_url")
+
+    def __init__(self, name: str, node_id: Optional[str] = None) -> None:
         """
         Initialize a Chat Model node.
 
         Args:
             name: Display name for the node
-            parent: Tag of the parent node editor
+            node_id: Identifier to restore (a new one is generated if None)
         """
-        super().__init__(name, parent, exec_cb, delete_cb)
+        super().__init__(name, node_id)
 
         # Define node fields with model configuration
         self.fields = {
@@ -306,41 +567,74 @@ class ChatModelNode(NodeBase):
             },
         }
 
-        # Initialize the node UI and configuration
-        self.node_ui()
+        # Initialize the node state
         self.node_configure()
-        self.setup_node_inspector()
 
-    def save(self) -> None:
-        """
-        Save changes from inspector inputs back to node state.
+    def response_key(self) -> str:
+        """Durable store key: every field that influences the completion."""
+        return content_key(
+            self.state["model"],
+            self.state["base_url"],
+            float(self.state["temperature"]),
+            int(self.state["max_tokens"]),
+            self.state["system_prompt"],
+            self.state["query"],
+        )
 
-        Updates all model configuration parameters from UI inputs.
+    def execute(self) -> Dict[str, Any]:
         """
-        # Update state from UI input values
-        for field_key in self.fields.keys():
-            input_tag = f"{self.id}_{field_key}"
-            self.state[field_key] = dpg.get_value(item=input_tag)
+        Execute the chat model query.
 
-        # Update the status display on the node
-        status_text = f"{self.state['model']}\n{self.state['base_url']}"
-        dpg.set_value(f"{self.id}_state", value=status_text)
+        Stored responses are reused; otherwise the OpenAI-compatible
+        chat completions endpoint at base_url is called and the reply
+        is written to the store.
 
-        # Debug output
-        console.print(f"[cyan]Saved node: {self.id[-8:]}[/cyan]")
-        console.print(f"  State: {self.state}")
-
-        # Close the inspector
-        self.close_inspector()
+        Returns:
+            Item with the model, query and response text
+        """
+        store = chat_response_store()
+        key = self.response_key()
+
+        stored = store.get(key)
+        if stored is not None:
+            response = stored.decode("utf-8")
+        else:
+            response = self.complete()
+            store.put(key, response.encode("utf-8"))
+
+        return {
+            "model": self.state["model"],
+            "query": self.state["query"],
+            "response": response,
+        }
 
-    def execute(self) -> Dict[str, Any]:
+    def complete(self) -> str:
         """
-        Execute the chat model query (placeholder implementation).
+        Request a completion from the model server.
 
         Returns:
-            Current node state with model configuration
+            Content of the first choice's message
         """
-        return self.state
+        payload = {
+            "model": self.state["model"],
+            "messages": [
+                {"role": "system", "content": self.state["system_prompt"]},
+                {"role": "user", "content": self.state["query"]},
+            ],
+            "temperature": float(self.state["temperature"]),
+            "max_tokens": int(self.state["max_tokens"]),
+        }
+        request = urllib.request.Request(
+            f"{self.state['base_url'].rstrip('/')}/v1/chat/completions",
+            data=json.dumps(payload).encode("utf-8"),
+            headers={"Content-Type": "application/json"},
+            method="POST",
+        )
+
+        with urllib.request.urlopen(request, timeout=self.state["timeout"]) as reply:
+            body = json.load(reply)
+
+        return body["choices"][0]["message"]["content"]
 
 
 # ============================================================================
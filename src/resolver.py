@@ -0,0 +1,130 @@
+"""
+Field expression resolver.
+
+Node fields may reference the item being processed with ``{{ ... }}``
+expressions, e.g. ``"{{$json.url}}/search"`` or ``"{{$input.first().id}}"``.
+Available references:
+
+- ``$json``: the current input item
+- ``$input``: ``item``, plus ``all()``, ``first()`` and ``last()`` helpers
+- ``$parameter``: the node's own (unresolved) field values
+- ``$now``: the current local time as ``YYYYmmdd_HHMMSS``
+"""
+
+import re
+import time
+from typing import Any, Dict, List, Tuple
+
+EXPRESSION_PATTERN = re.compile(r"\{\{\s*(.*?)\s*\}\}")
+
+
+def build_scope(
+    item: Dict[str, Any], items: List[Dict[str, Any]], parameters: Dict[str, Any]
+) -> Dict[str, Any]:
+    """
+    Build the reference scope for resolving one item.
+
+    Args:
+        item: Input item currently being processed
+        items: All input items of the node
+        parameters: The node's field values
+
+    Returns:
+        Scope dictionary keyed by reference name (without the leading $)
+    """
+    return {
+        "json": item,
+        "input": {
+            "item": item,
+            "all": lambda: items,
+            "first": lambda: items[0] if items else {},
+            "last": lambda: items[-1] if items else {},
+        },
+        "parameter": parameters,
+        "now": time.strftime("%Y%m%d_%H%M%S"),
+    }
+
+
+def resolve_single(
+    expr_body: str, scope: Dict[str, Any], errors: List[str], field_key: str
+) -> Any:
+    """Resolve a $variable.attribute chain from inside {{ }}."""
+    if not expr_body.startswith("$"):
+        errors.append(f"[{field_key}] Expression must start with $: {expr_body}")
+        return None
+
+    parts = expr_body[1:].split(".")
+
+    # Top-level reference
+    if parts[0] not in scope:
+        errors.append(f"[{field_key}] Unknown reference: {parts[0]}")
+        return None
+
+    obj = scope[parts[0]]
+
+    # Resolve chained parts
+    for p in parts[1:]:
+        try:
+            if p.endswith("()"):  # helper function call
+                method = p[:-2]
+                if isinstance(obj, dict) and method in obj and callable(obj[method]):
+                    obj = obj[method]()
+                else:
+                    raise KeyError(f"'{method}' is not callable on {obj}")
+            elif isinstance(obj, dict) and p in obj:
+                obj = obj[p]
+            elif isinstance(obj, list) and p.isdigit() and int(p) < len(obj):
+                obj = obj[int(p)]
+            else:
+                raise KeyError(f"Key '{p}' not found in {obj}")
+        except Exception as e:
+            errors.append(
+                f"[{field_key}] Failed to resolve '{{{{{expr_body}}}}}': {e}"
+            )
+            return None
+
+    return obj
+
+
+def resolve_value(
+    value: Any, scope: Dict[str, Any], errors: List[str], field_key: str
+) -> Any:
+    """
+    Resolve all {{ ... }} occurrences inside a field value.
+
+    Non-string values are returned untouched. A value consisting of a
+    single expression keeps the referenced object's type; expressions
+    embedded in longer text are substituted as strings.
+    """
+    if not isinstance(value, str) or "{{" not in value:
+        return value
+
+    # "{{ $json.a }}-{{ $json.b }}" also fullmatches: one expression only
+    # if its body contains no closing braces
+    whole = EXPRESSION_PATTERN.fullmatch(value.strip())
+    if whole and "}}" not in whole.group(1):
+        return resolve_single(whole.group(1), scope, errors, field_key)
+
+    def repl(match):
+        resolved = resolve_single(match.group(1), scope, errors, field_key)
+        return "" if resolved is None else str(resolved)
+
+    return EXPRESSION_PATTERN.sub(repl, value)
+
+
+def resolve_fields(
+    values: Dict[str, Any], scope: Dict[str, Any]
+) -> Tuple[Dict[str, Any], List[str]]:
+    """
+    Resolve every field value against a scope.
+
+    Returns:
+        Tuple of (resolved values, list of error messages)
+    """
+    resolved = {}
+    errors = []
+
+    for key, value in values.items():
+        resolved[key] = resolve_value(value, scope, errors, key)
+
+    return resolved, errors
@@ -0,0 +1,149 @@
+"""
+Headless workflow runner.
+
+Runs a saved workflow without the editor (DearPyGui is never imported)
+and writes the output items of its leaf nodes as JSON lines, each as soon
+as the node completes::
+
+    python -m src.run workflow.json --inputs items.jsonl --workers 16
+
+Every output line has the form {"node": id, "name": name, "item": {...}}.
+Input items (one JSON object per line) are fed to the workflow's root
+nodes. Engine logs go to stderr and are silenced unless --verbose is set.
+The exit status is 1 if any node failed. Output stops quietly when the
+reader goes away (e.g. piped into ``head``); the run itself completes.
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import sys
+import threading
+from typing import Any, Dict, List, Optional, TextIO
+
+from .node_base import console
+from .workflow import CycleError, Executor, Workflow
+
+
+def read_items(stream: TextIO) -> List[Dict[str, Any]]:
+    """Parse JSON lines into items, skipping blank lines."""
+    items = []
+    for number, line in enumerate(stream, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        item = json.loads(line)
+        if not isinstance(item, dict):
+            raise ValueError(f"Input line {number} is not a JSON object")
+        items.append(item)
+    return items
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m src.run", description="Run a saved Lighthouse workflow."
+    )
+    parser.add_argument("workflow", help="Workflow file saved from the editor")
+    parser.add_argument(
+        "--inputs", help="JSONL file of input items for the root nodes ('-': stdin)"
+    )
+    parser.add_argument("--output", help="Write results to this file (default: stdout)")
+    parser.add_argument("--workers", type=int, help="Thread pool size")
+    parser.add_argument("--processes", type=int, help="Process pool size")
+    parser.add_argument(
+        "--streaming",
+        action="store_true",
+        help="Stream items between nodes as they are produced",
+    )
+    parser.add_argument(
+        "--verbose", action="store_true", help="Print engine logs to stderr"
+    )
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Run a workflow from the command line.
+
+    Returns:
+        Process exit status
+    """
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    console.quiet = not args.verbose
+
+    inputs = None
+    try:
+        if args.inputs == "-":
+            inputs = read_items(sys.stdin)
+        elif args.inputs:
+            with open(args.inputs, "r", encoding="utf-8") as f:
+                inputs = read_items(f)
+    except (OSError, ValueError) as e:
+        parser.error(f"cannot read --inputs: {e}")
+
+    executor = Executor(
+        max_workers=args.workers,
+        max_processes=args.processes,
+        streaming=args.streaming,
+        # A one-shot run never reuses outputs: keep only the leaves'
+        retain_outputs=False,
+    )
+    try:
+        workflow = Workflow.load(args.workflow, executor)
+    except (OSError, ValueError, CycleError) as e:
+        parser.error(f"cannot open workflow: {e}")
+    leaves = {nid for nid in workflow.nodes if not workflow.graph.successors(nid)}
+
+    out = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    write_lock = threading.Lock()
+    closed = threading.Event()
+
+    def write_results(node_id: str, status: str) -> None:
+        # Outputs are recorded before COMPLETED is published
+        if status != "COMPLETED" or node_id not in leaves or closed.is_set():
+            return
+        name = workflow.nodes[node_id].name
+        lines = [
+            json.dumps({"node": node_id, "name": name, "item": item}, default=str)
+            for item in executor.node_outputs.get(node_id, [])
+        ]
+        with write_lock:
+            try:
+                for line in lines:
+                    out.write(line + "\n")
+                out.flush()
+            except BrokenPipeError:
+                # The reader is gone: stop writing, let the run finish
+                closed.set()
+                if out is sys.stdout:
+                    # Keep the interpreter's exit-time flush from failing
+                    devnull = os.open(os.devnull, os.O_WRONLY)
+                    os.dup2(devnull, sys.stdout.fileno())
+
+    executor.subscribe(write_results)
+    try:
+        workflow.run(inputs=inputs)
+        workflow.join()
+    finally:
+        workflow.shutdown()
+        if out is not sys.stdout:
+            out.close()
+
+    failures = [
+        trace
+        for execution in executor.execution_array
+        for trace in execution["traces"]
+        if not trace["success"]
+    ]
+    for trace in failures:
+        name = workflow.nodes[trace["node_id"]].name
+        print(f"{name} ({trace['node_id']}) failed: {trace['error']}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    # Required for process-mode nodes in frozen builds
+    multiprocessing.freeze_support()
+    sys.exit(main())
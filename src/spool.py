@@ -0,0 +1,236 @@
+"""
+Spool files for response bodies too large to keep in node state.
+
+A spooled body is written to disk in fixed-size chunks as it arrives and
+handed downstream as a SpooledBody: a small dict (so it stays JSON- and
+pickle-friendly and resolvable in field expressions, e.g.
+``{{ $json.body.path }}``) with methods to open or map the file lazily.
+
+A spool file lives as long as the node output that refers to it: the
+executor deletes it once that output is replaced by a new run or the node
+is removed (see release_spooled). A file that cannot be removed yet is
+retried whenever another body is spooled, and files left behind by a
+crash are pruned after SPOOL_MAX_AGE.
+"""
+
+import mmap
+import os
+import tempfile
+import threading
+import time
+from typing import Any, BinaryIO, Dict, Iterable, List, Optional
+
+# Chunk size used when copying bodies to disk
+SPOOL_CHUNK_SIZE = 256 * 1024
+
+# Spool files older than this are removed when the first body is spooled
+# in a directory
+SPOOL_MAX_AGE = 24 * 60 * 60
+
+_pruned = set()
+_prune_lock = threading.Lock()
+# Spool files whose deletion failed, retried by spool_file()
+_undeleted = set()
+
+
+class SpooledBody(dict):
+    """
+    Handle to a response body stored in a spool file.
+
+    Keys:
+        path (str): Spool file
+        size (int): Body size in bytes
+        content_type (str): Content-Type of the response
+    """
+
+    def __init__(self, path: str, size: int, content_type: str = "") -> None:
+        super().__init__(path=path, size=size, content_type=content_type)
+
+    @property
+    def path(self) -> str:
+        return self["path"]
+
+    @property
+    def size(self) -> int:
+        return self["size"]
+
+    def open(self) -> BinaryIO:
+        """Open the body for reading (caller closes the file)."""
+        return open(self.path, "rb")
+
+    def view(self) -> memoryview:
+        """
+        Map the body into memory without reading it.
+
+        Returns:
+            Read-only memoryview backed by the spool file; pages are
+            loaded on access and shared with the OS page cache
+        """
+        if self.size == 0:
+            return memoryview(b"")
+        with open(self.path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return memoryview(mapped)
+
+    def text(self, encoding: str = "utf-8") -> str:
+        """Read the whole body as text (loads it into memory)."""
+        with self.open() as f:
+            return f.read().decode(encoding, errors="replace")
+
+    def delete(self) -> bool:
+        """
+        Remove the spool file.
+
+        A file that cannot be removed yet (on Windows, one still mapped by
+        view()) is retried when the next body is spooled, and left to the
+        age-based prune if it never can be.
+
+        Returns:
+            False if the file is still there
+        """
+        if _remove(self.path):
+            return True
+        with _prune_lock:
+            _undeleted.add(self.path)
+        return False
+
+
+def release_spooled(
+    items: List[Dict[str, Any]], keep: Iterable[Dict[str, Any]] = ()
+) -> int:
+    """
+    Delete the spool files referenced by superseded output items.
+
+    Args:
+        items: Output items being dropped
+        keep: Output items replacing them; files they still refer to
+            are kept
+
+    Returns:
+        Number of spool files deleted
+    """
+    kept = {body.path for body in _spooled_values(keep)}
+    deleted = 0
+    for body in _spooled_values(items):
+        if body.path not in kept:
+            kept.add(body.path)
+            deleted += body.delete()
+    return deleted
+
+
+def _spooled_values(items: Iterable[Dict[str, Any]]) -> List[SpooledBody]:
+    """SpooledBody values found at the top level of output items."""
+    return [
+        value
+        for item in items
+        if isinstance(item, dict)
+        for value in item.values()
+        if isinstance(value, SpooledBody)
+    ]
+
+
+def _remove(path: str) -> bool:
+    """Remove a file; False if it exists but cannot be removed (yet)."""
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+    except OSError:
+        return False
+    return True
+
+
+def spool_file(directory: str, suffix: str = ".body") -> BinaryIO:
+    """
+    Create a new spool file.
+
+    Files whose deletion failed earlier are retried, and stale files are
+    pruned on first use of a directory.
+
+    Args:
+        directory: Spool directory; created if missing
+        suffix: File name suffix
+
+    Returns:
+        File opened for binary writing (its name is the spool path)
+    """
+    os.makedirs(directory, exist_ok=True)
+    with _prune_lock:
+        for path in [path for path in _undeleted if _remove(path)]:
+            _undeleted.discard(path)
+        if directory not in _pruned:
+            _pruned.add(directory)
+            prune_spool(directory, SPOOL_MAX_AGE)
+    fd, path = tempfile.mkstemp(prefix="lighthouse-", suffix=suffix, dir=directory)
+    os.close(fd)
+    return open(path, "wb")
+
+
+def prune_spool(directory: str, max_age: float) -> int:
+    """
+    Delete spool files older than max_age seconds.
+
+    Returns:
+        Number of files deleted
+    """
+    cutoff = time.time() - max_age
+    deleted = 0
+    for entry in os.scandir(directory):
+        if entry.name.startswith("lighthouse-") and entry.is_file():
+            try:
+                if entry.stat().st_mtime < cutoff:
+                    os.remove(entry.path)
+                    deleted += 1
+            except OSError:
+                pass
+    return deleted
+
+
+def read_body(
+    response: Any, threshold: int, directory: str, content_type: str = ""
+) -> Any:
+    """
+    Read a response body into memory, or stream it to a spool file once it
+    grows past threshold bytes.
+
+    Chunks are read into one reusable buffer and written from a memoryview,
+    so a spooled body is never held in memory as a whole.
+
+    Args:
+        response: Object with readinto() (e.g. PooledResponse)
+        threshold: Largest body kept in memory, in bytes
+        directory: Spool directory
+        content_type: Content-Type recorded on the SpooledBody
+
+    Returns:
+        The body as bytes, or a SpooledBody
+    """
+    buffer = bytearray(SPOOL_CHUNK_SIZE)
+    view = memoryview(buffer)
+    data = bytearray()
+    spool: Optional[BinaryIO] = None
+    size = 0
+    try:
+        while True:
+            count = response.readinto(buffer)
+            if not count:
+                break
+            size += count
+            if spool is None and size > threshold:
+                spool = spool_file(directory)
+                spool.write(data)
+                data = None
+            if spool is not None:
+                spool.write(view[:count])
+            else:
+                data += view[:count]
+    except BaseException:
+        if spool is not None:
+            spool.close()
+            os.remove(spool.name)
+        raise
+
+    if spool is None:
+        return bytes(data)
+    spool.close()
+    return SpooledBody(spool.name, size, content_type)
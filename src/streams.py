@@ -0,0 +1,96 @@
+import asyncio
+import time
+from typing import Any, Dict
+
+# Stream markers sent after a producer's last item
+END_OF_STREAM = object()
+UPSTREAM_FAILED = object()
+
+
+class UpstreamFailed(Exception):
+    """Raised in a streaming node when one of its producers failed."""
+
+
+class EdgeQueue:
+    """
+    Bounded queue carrying items along one edge of a streaming execution.
+
+    A full queue suspends the producer until the consumer catches up
+    (backpressure), so a fast node cannot buffer an unbounded number of
+    items ahead of a slow one. Synchronous generator producers are only
+    advanced after their previous item was accepted, so they are held
+    back the same way. The queue keeps gauges that show where a pipeline
+    is saturated.
+
+    Attributes:
+        source (str): Producing node id
+        target (str): Consuming node id
+        capacity (int): Maximum buffered items (0 means unbounded)
+        items_total (int): Items put on the edge so far
+        high_water (int): Largest depth observed
+        blocked_time (float): Seconds the producer spent waiting on a full queue
+        closed (bool): Set when the consumer stopped reading
+    """
+
+    def __init__(self, source: str, target: str, capacity: int = 0) -> None:
+        self.source = source
+        self.target = target
+        self.capacity = capacity
+        self.items_total = 0
+        self.high_water = 0
+        self.blocked_time = 0.0
+        self.closed = False
+        self._queue = asyncio.Queue(maxsize=capacity)
+
+    @property
+    def depth(self) -> int:
+        """Items currently buffered on the edge."""
+        return self._queue.qsize()
+
+    async def put(self, item: Any) -> None:
+        """
+        Put an item (or stream marker), waiting while the queue is full.
+
+        Items put after the consumer closed the edge are dropped.
+        """
+        if self.closed:
+            return
+
+        if self._queue.full():
+            waited = time.time()
+            await self._queue.put(item)
+            self.blocked_time += time.time() - waited
+        else:
+            self._queue.put_nowait(item)
+
+        if item is not END_OF_STREAM and item is not UPSTREAM_FAILED:
+            self.items_total += 1
+        self.high_water = max(self.high_water, self._queue.qsize())
+
+    async def get(self) -> Any:
+        """Take the next item, waiting until one is available."""
+        return await self._queue.get()
+
+    def close(self) -> None:
+        """
+        Stop accepting items and discard buffered ones.
+
+        Called when the consumer stops early so a producer blocked on a
+        full queue is released instead of waiting forever.
+        """
+        self.closed = True
+        while not self._queue.empty():
+            self._queue.get_nowait()
+
+    def gauge(self) -> Dict[str, Any]:
+        """Snapshot of the edge's queue statistics."""
+        return {
+            "source": self.source,
+            "target": self.target,
+            "capacity": self.capacity,
+            "depth": self.depth,
+            "high_water": self.high_water,
+            "items_total": self.items_total,
+            "blocked_time": self.blocked_time,
+            "saturated": bool(self.capacity) and self.high_water >= self.capacity,
+        }
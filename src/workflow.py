@@ -0,0 +1,410 @@
+"""
+Headless workflow engine and its file format.
+
+Workflows are saved as JSON documents::
+
+    {
+      "version": 1,
+      "nodes": [
+        {"id": "3f2a9c1e", "type": "HTTPRequestNode", "name": "HTTP Request",
+         "pos": [120, 80], "state": {"url": "...", "type": "GET", ...}},
+        ...
+      ],
+      "links": [["<source id>", "<target id>"], ...]
+    }
+
+"type" is the node class name (see NODE_TYPES) and "state" holds the
+node's field values; fields missing from the file keep their defaults.
+Nodes are written in topological order, so loading never reorders the
+graph index.
+
+JSON is the interchange format. Files ending in ".lhw" use the compact
+binary encoding instead: BINARY_MAGIC followed by the same document as
+zlib-compressed, whitespace-free JSON. load() detects either encoding.
+"""
+
+import copy
+import json
+import zlib
+
+from .executor import *
+
+# Version written to saved workflows
+WORKFLOW_FORMAT_VERSION = 1
+
+# Header of the compact binary encoding, and the extension that selects it
+BINARY_MAGIC = b"LHWF\x01"
+BINARY_SUFFIX = ".lhw"
+
+# Node classes by the type name stored in workflow files
+NODE_TYPES: Dict[str, type] = {
+    member.value.__name__: member.value
+    for node_types in (TriggerNodes, ExecutionNodes)
+    for member in node_types
+}
+
+
+def encode_workflow(data: Dict[str, Any], binary: bool = False) -> bytes:
+    """
+    Encode a serialized workflow as file contents.
+
+    Args:
+        data: Workflow document (see Workflow.to_dict)
+        binary: Use the compact binary encoding instead of indented JSON
+
+    Returns:
+        Encoded document
+    """
+    if not binary:
+        return json.dumps(data, indent=2).encode("utf-8")
+    compact = json.dumps(data, separators=(",", ":")).encode("utf-8")
+    return BINARY_MAGIC + zlib.compress(compact)
+
+
+def decode_workflow(raw: bytes) -> Dict[str, Any]:
+    """
+    Decode file contents written by encode_workflow (either encoding).
+
+    Raises:
+        ValueError: If the contents are not a valid workflow document
+    """
+    try:
+        if raw.startswith(BINARY_MAGIC):
+            raw = zlib.decompress(raw[len(BINARY_MAGIC):])
+        data = json.loads(raw)
+    except (zlib.error, UnicodeDecodeError, json.JSONDecodeError) as e:
+        raise ValueError(f"Invalid workflow file: {e}") from e
+
+    if not isinstance(data, dict):
+        raise ValueError("Invalid workflow file: expected a JSON object")
+    return data
+
+
+class Workflow:
+    """
+    Headless workflow engine: nodes, the links between them and the
+    executor that runs them.
+
+    Holds no GUI references. The editor (LighthouseApp) is a thin view
+    that forwards edits here and subscribes to the executor's status
+    events; scripts, servers and CI drive a Workflow directly.
+
+    Attributes:
+        nodes (Dict[str, NodeBase]): Nodes by id
+        graph (GraphIndex): Links between nodes, indexed in both directions
+        executor (Executor): Runs workflows on bounded worker pools
+    """
+
+    def __init__(self, executor: Optional[Executor] = None) -> None:
+        """
+        Create an empty workflow.
+
+        Args:
+            executor: Executor running the workflow (default: a new one)
+        """
+        self.nodes: Dict[str, NodeBase] = {}
+        self.graph = GraphIndex()
+        self.executor = executor if executor is not None else Executor()
+        self._plan: Optional[ExecutionPlan] = None
+        # Root input items of the last run (None: one empty item)
+        self._inputs: Optional[List[Dict[str, Any]]] = None
+
+    def add_node(self, node: NodeBase) -> NodeBase:
+        """Register a node and its link endpoints; returns the node."""
+        self.nodes[node.id] = node
+        self.graph.add_node(node.id, [node.input_attr, node.output_attr])
+        node.change_cb = self.invalidate
+        return node
+
+    def remove_node(self, node_id: str) -> None:
+        """Remove a node and its links, invalidating its children."""
+        # Children lose an input: invalidate them before unlinking
+        for target_node in list(self.graph.successors(node_id)):
+            self.invalidate(target_node)
+        self.executor.forget(node_id)
+
+        self.nodes.pop(node_id, None)
+        self.graph.remove_node(node_id)
+
+    def link(self, source_id: str, target_id: str) -> None:
+        """
+        Link a node's output to another node's input.
+
+        Raises:
+            CycleError: If the link would make the graph cyclic
+        """
+        self.link_attributes(
+            self.nodes[source_id].output_attr, self.nodes[target_id].input_attr
+        )
+
+    def link_attributes(self, source_attr: str, target_attr: str) -> Tuple[str, str]:
+        """
+        Link two node attributes and invalidate the target node.
+
+        Returns:
+            Tuple of (source node id, target node id)
+
+        Raises:
+            CycleError: If the link would make the graph cyclic
+        """
+        source_id, target_id = self.graph.link(source_attr, target_attr)
+
+        # The target's inputs changed: invalidate it and its descendants
+        self.invalidate(target_id)
+        return source_id, target_id
+
+    def unlink_attributes(
+        self, source_attr: str, target_attr: str
+    ) -> Optional[Tuple[str, str]]:
+        """
+        Remove the link between two attributes and invalidate the target.
+
+        Returns:
+            Tuple of (source node id, target node id), or None if the
+            attributes were not linked
+        """
+        unlinked = self.graph.unlink(source_attr, target_attr)
+        if unlinked is not None:
+            self.invalidate(unlinked[1])
+        return unlinked
+
+    def clear(self) -> None:
+        """Remove every node and link, along with their recorded outputs."""
+        for node_id in self.nodes:
+            self.executor.forget(node_id)
+        self.nodes.clear()
+        self.graph.clear()
+        self._plan = None
+
+    def invalidate(self, node_id: str) -> None:
+        """Invalidate a node and its descendants after an edit or relink."""
+        self.executor.mark_dirty(node_id, self.nodes, self.graph)
+
+    def execution_plan(self) -> ExecutionPlan:
+        """
+        Return the compiled execution plan of the graph.
+
+        The plan (topological levels and adjacency) is memoized by the
+        graph index and only recompiled after a node or link edit, along
+        with the schedules the executor derives from it for each set of
+        nodes run. The index rejects cyclic links, so the plan always
+        covers a DAG.
+
+        Returns:
+            Execution plan for the current graph generation
+        """
+        plan = self.graph.execution_plan()
+        if plan is not self._plan:
+            self._plan = plan
+            for i, level in enumerate(plan.levels):
+                node_names = [self.nodes[nid].name for nid in level]
+                console.print(f"  Level {i}: {node_names}")
+        return plan
+
+    def run(
+        self,
+        node_id: Optional[str] = None,
+        inputs: Optional[List[Dict[str, Any]]] = None,
+    ) -> bool:
+        """
+        Queue a run on the executor.
+
+        With a node id, that node and everything downstream of it run,
+        plus the stale ancestors they need; otherwise every stale node runs,
+        with independent components executing concurrently. Clean nodes
+        reuse their last outputs. Input items that differ from the last
+        run's invalidate the root nodes and everything downstream.
+
+        Args:
+            node_id: Node the run was triggered from (None runs everything)
+            inputs: Input items for the root nodes (default: one empty item)
+
+        Returns:
+            False if there was nothing to execute
+        """
+        if inputs != self._inputs:
+            # Root nodes consume the input items: new items invalidate them
+            # (and, through them, everything downstream)
+            roots = [nid for nid in self.nodes if not self.graph.predecessors(nid)]
+            for root_id in roots:
+                self.invalidate(root_id)
+            self._inputs = copy.deepcopy(inputs)
+
+        if node_id is not None:
+            selected = self.executor.plan(node_id, self.nodes, self.graph)
+        else:
+            selected = {
+                nid for nid in self.nodes if self.executor.is_stale(nid, self.nodes)
+            }
+
+        if not selected:
+            console.print("[cyan]Nothing to execute: all outputs are up to date[/cyan]")
+            return False
+
+        plan = self.execution_plan()
+        execution_order = plan.subset_order(selected)
+        console.print(execution_order)
+        execution_nodes = [self.nodes[i] for i in execution_order]
+
+        # Hand the run to the background executor; each node starts as
+        # soon as its upstream nodes finish, statuses come back as events
+        self.executor.submit(
+            execution_order, execution_nodes, plan.predecessors, inputs, plan
+        )
+        return True
+
+    def join(self) -> None:
+        """Block until every queued run has finished."""
+        self.executor.join()
+
+    def shutdown(self) -> None:
+        """Release the executor's worker pools."""
+        self.executor.shutdown()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the workflow's nodes and links (see module docstring)."""
+        nodes = [
+            {
+                "id": node.id,
+                "type": type(node).__name__,
+                "name": node.name,
+                "pos": list(node.pos),
+                "state": {k: v for k, v in node.state.items() if k != "input"},
+            }
+            for node in map(self.nodes.get, self.graph.execution_plan().order)
+        ]
+        links = sorted(
+            [self.graph.node_of(source), self.graph.node_of(target)]
+            for source, target in self.graph.edges
+        )
+        return {"version": WORKFLOW_FORMAT_VERSION, "nodes": nodes, "links": links}
+
+    def restore(self, data: Dict[str, Any]) -> None:
+        """
+        Replace the workflow's contents with to_dict() output.
+
+        Nodes are built in bulk: node construction logs are silenced and
+        links are indexed directly, without the per-link invalidation an
+        edit needs (every loaded node starts dirty). The document is
+        checked in full before anything is replaced, so the workflow is
+        left unchanged if it is invalid.
+
+        Args:
+            data: Serialized workflow
+
+        Raises:
+            ValueError: If the document is malformed, has an unsupported
+                version, an unknown node type or a link to a missing node
+            CycleError: If the links contain a cycle
+        """
+        if not isinstance(data, dict):
+            raise ValueError("Workflow document must be an object")
+        version = data.get("version", WORKFLOW_FORMAT_VERSION)
+        if not isinstance(version, int) or isinstance(version, bool):
+            raise ValueError(f"Invalid workflow version: {version!r}")
+        if version > WORKFLOW_FORMAT_VERSION:
+            raise ValueError(f"Unsupported workflow version: {version}")
+
+        entries = data.get("nodes", [])
+        links = data.get("links", [])
+        if not isinstance(entries, list) or not isinstance(links, list):
+            raise ValueError("Workflow nodes and links must be lists")
+        for entry in entries:
+            if not (
+                isinstance(entry, dict)
+                and isinstance(entry.get("id"), str)
+                and isinstance(entry.get("type"), str)
+                and isinstance(entry.get("state", {}), dict)
+                and isinstance(entry.get("pos", []), (list, tuple))
+            ):
+                raise ValueError(f"Invalid node entry: {entry!r}")
+        for link in links:
+            if not isinstance(link, (list, tuple)) or len(link) != 2:
+                raise ValueError(f"Invalid link: {link!r}")
+
+        nodes: Dict[str, NodeBase] = {}
+        quiet = console.quiet
+        console.quiet = True
+        try:
+            for entry in entries:
+                node_cls = NODE_TYPES.get(entry["type"])
+                if node_cls is None:
+                    raise ValueError(f"Unknown node type: {entry['type']}")
+
+                node = node_cls(entry.get("name", entry["type"]), node_id=entry["id"])
+                node.pos = list(entry.get("pos", node.pos))
+                state = entry.get("state", {})
+                node.state.update({k: v for k, v in state.items() if k in node.fields})
+                nodes[node.id] = node
+        finally:
+            console.quiet = quiet
+
+        for source_id, target_id in links:
+            if source_id not in nodes or target_id not in nodes:
+                raise ValueError(f"Link to unknown node: {source_id} -> {target_id}")
+
+        # Index the links aside first, so a cycle leaves the workflow as is
+        self._index_links(GraphIndex(), nodes, links)
+
+        # Refill in place: the editor holds references to nodes and graph
+        self.clear()
+        self._index_links(self.graph, nodes, links)
+        for node in nodes.values():
+            node.change_cb = self.invalidate
+        self.nodes.update(nodes)
+
+    @staticmethod
+    def _index_links(
+        graph: GraphIndex, nodes: Dict[str, NodeBase], links: List[Any]
+    ) -> None:
+        """Add nodes and their links to graph (raises CycleError on a cycle)."""
+        for node in nodes.values():
+            graph.add_node(node.id, [node.input_attr, node.output_attr])
+        for source_id, target_id in links:
+            graph.link(nodes[source_id].output_attr, nodes[target_id].input_attr)
+
+    @classmethod
+    def from_dict(
+        cls, data: Dict[str, Any], executor: Optional[Executor] = None
+    ) -> "Workflow":
+        """
+        Build a workflow from to_dict() output.
+
+        Args:
+            data: Serialized workflow
+            executor: Executor running the workflow (default: a new one)
+
+        Raises:
+            ValueError: If the document has an unsupported version, an
+                unknown node type or a link to a missing node
+            CycleError: If the links contain a cycle
+        """
+        workflow = cls(executor)
+        workflow.restore(data)
+        return workflow
+
+    def save(self, path: str, binary: Optional[bool] = None) -> None:
+        """
+        Write the workflow to a file.
+
+        Args:
+            path: Destination file
+            binary: Use the compact binary encoding (default: only for
+                paths ending in BINARY_SUFFIX)
+        """
+        if binary is None:
+            binary = path.endswith(BINARY_SUFFIX)
+        with open(path, "wb") as f:
+            f.write(encode_workflow(self.to_dict(), binary))
+
+    def open_file(self, path: str) -> None:
+        """Replace the workflow's contents with a file written by save()."""
+        with open(path, "rb") as f:
+            self.restore(decode_workflow(f.read()))
+
+    @classmethod
+    def load(cls, path: str, executor: Optional[Executor] = None) -> "Workflow":
+        """Read a workflow from a file written by save() (either encoding)."""
+        workflow = cls(executor)
+        workflow.open_file(path)
+        return workflow